@@ -1,19 +1,25 @@
 # cogitto-medication-ai/app.py
 # app.py - Cogitto: Medication AI Assistant
+# Time every import and init stage from here on (report: GET /stats/startup)
+from app.infrastructure.diagnostics.startup_profiler import StartupProfiler
+STARTUP_PROFILER = StartupProfiler()
+
 # Add these imports at the top
 from dotenv import load_dotenv
 import os
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import secrets
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 import uvicorn
 
 # Add these imports to the top of your existing app.py
 import uuid
 from datetime import datetime
-from openai import AsyncOpenAI
 import json
 
 # Load environment variables
@@ -21,11 +27,13 @@ load_dotenv()
 
 # Initialize database connection after loading environment variables
 from app.infrastructure.database.connection import db_connection
-db_connection.initialize()
+with STARTUP_PROFILER.stage("database"):
+    db_connection.initialize()
 
 # Initialize authentication components
 from app.infrastructure.auth.dependencies import initialize_auth_components
-initialize_auth_components()
+with STARTUP_PROFILER.stage("auth"):
+    initialize_auth_components()
 
 # Add these imports to the top of your app.py (after your existing imports)
 from app.routers.auth import auth_router
@@ -40,6 +48,9 @@ else:
 
 # Data models
 class Medication(BaseModel):
+    # Also validates catalog records/views that expose fields as attributes
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     generic_name: str
     brand_names: List[str]
@@ -48,11 +59,37 @@ class Medication(BaseModel):
     prescription_required: bool
     indications: List[str]
     warnings: List[str]
+    manufacturer: Optional[str] = None
+    data_source: Optional[str] = None
 
 class SearchResult(BaseModel):
     query: str
     results: List[Medication]
     count: int
+    total: int = 0
+    next_cursor: Optional[str] = None
+    match_type: str = "substring"
+
+class AutocompleteSuggestion(BaseModel):
+    id: str
+    text: str
+    generic_name: str
+    match_type: str
+    exact: bool
+
+class AutocompleteResult(BaseModel):
+    query: str
+    suggestions: List[AutocompleteSuggestion]
+    count: int
+
+class BatchLookupRequest(BaseModel):
+    ids: List[str] = []
+    names: List[str] = []
+
+class BatchLookupResult(BaseModel):
+    medications: List[Medication]
+    not_found: List[str]
+    count: int
 
 class InteractionCheck(BaseModel):
     medication1: str
@@ -63,6 +100,53 @@ class InteractionCheck(BaseModel):
     recommendation: Optional[str] = None
     disclaimer: str
 
+# Largest regimen POST /interactions/check-regimen accepts
+MAX_REGIMEN_SIZE = 100
+# Most regimens one POST /interactions/screen-regimens call screens
+MAX_SCREEN_REGIMENS = 1000
+
+class RegimenCheckRequest(BaseModel):
+    medications: List[str] = Field(max_length=MAX_REGIMEN_SIZE)
+
+class RegimenInteraction(BaseModel):
+    medications: List[str]
+    severity: Optional[str] = None
+    description: Optional[str] = None
+    recommendation: Optional[str] = None
+
+class RegimenCheckResult(BaseModel):
+    medications: List[str]
+    interactions: List[RegimenInteraction]
+    count: int
+    highest_severity: Optional[str] = None
+    disclaimer: str
+
+class RegimenScreenRequest(BaseModel):
+    regimens: List[Annotated[List[str], Field(max_length=MAX_REGIMEN_SIZE)]] = Field(max_length=MAX_SCREEN_REGIMENS)
+
+class RegimenScreenResult(BaseModel):
+    index: int
+    interacting_pairs: int
+    highest_severity: Optional[str] = None
+
+class RegimenScreenResults(BaseModel):
+    results: List[RegimenScreenResult]
+    count: int
+    flagged: int
+    disclaimer: str
+
+class DrugInteraction(BaseModel):
+    medication: str
+    severity: Optional[str] = None
+    description: Optional[str] = None
+    recommendation: Optional[str] = None
+
+class DrugInteractionsResult(BaseModel):
+    medication: str
+    interactions: List[DrugInteraction]
+    count: int
+    disclaimer: str
+
 # Add these new data models for chat (add after your existing models)
 
 class ChatMessageRequest(BaseModel):
@@ -81,37 +165,131 @@ class ChatResponse(BaseModel):
 
 # Sample medication data
 # MEDICATIONS_DATA = []
-# Load the FDA medication data
-exec(open('data/fda_data_integration.py').read())  
-
-# Convert FDA data to Medication objects
-MEDICATIONS = [Medication(**med) for med in FDA_MEDICATIONS_DATA]
-
-# Drug interaction database
-INTERACTIONS = {
-    ("warfarin", "ibuprofen"): {
-        "severity": "major",
-        "description": "Increased bleeding risk due to antiplatelet effects",
-        "recommendation": "Avoid combination. Use acetaminophen instead for pain relief."
-    },
-    ("warfarin", "acetaminophen"): {
-        "severity": "moderate",
-        "description": "High doses may enhance warfarin effect",
-        "recommendation": "Monitor INR if using >2g/day acetaminophen"
-    },
-    ("lisinopril", "ibuprofen"): {
-        "severity": "moderate",
-        "description": "Reduced effectiveness of ACE inhibitor",
-        "recommendation": "Monitor blood pressure. Consider acetaminophen alternative."
-    },
-    ("metformin", "atorvastatin"): {
-        "severity": "minor",
-        "description": "Rare reports of muscle problems",
-        "recommendation": "Monitor for muscle pain or weakness"
-    }
-}
-# Update interactions with FDA data
-INTERACTIONS.update(FDA_INTERACTIONS)
+from app.infrastructure.catalog.snapshot import catalog_data_tag, load_catalog_data
+from app.infrastructure.catalog.base_interactions import BASE_INTERACTIONS
+from app.infrastructure.catalog.medication_catalog import MedicationCatalog, catalog_version
+from app.infrastructure.catalog.records import build_records
+from app.infrastructure.catalog.reloader import CatalogReloader
+from app.domain.services.search_ranking import MAX_PAGE_SIZE, rank_and_paginate
+from app.domain.services.medication_service import MAX_BATCH_SIZE
+from app.infrastructure.search.result_cache import SearchResultCache
+from app.infrastructure.search.text import normalize_name
+from app.api.conditional import CATALOG_CACHE_CONTROL, catalog_etag, etag_matches
+
+CATALOG_SNAPSHOT_PATH = os.getenv("COGITTO_CATALOG_SNAPSHOT", "data/catalog.snapshot")
+CATALOG_SOURCE_PATH = "data/fda_data_integration.py"
+COLUMNAR_CATALOG_PATH = os.getenv("COGITTO_CATALOG_COLUMNAR")
+
+def build_catalog() -> MedicationCatalog:
+    """Load the FDA data and build the catalog with all of its indexes.
+    
+    The data comes from the binary snapshot (rebuilt from
+    data/fda_data_integration.py only when that file is newer). Medications
+    are stored as compact slotted records with pooled strings, or - with
+    COGITTO_CATALOG_COLUMNAR set - as views on a columnar file that every
+    worker shares through the OS page cache. Either way medications are
+    rendered to JSON on first use and kept in the catalog's bounded cache;
+    other responses convert them to Medication models at the response
+    boundary (as_api_medications).
+    """
+    if COLUMNAR_CATALOG_PATH:
+        return build_columnar_catalog()
+    
+    snapshot = load_catalog_data(CATALOG_SNAPSHOT_PATH, CATALOG_SOURCE_PATH)
+    print(f"🏥 FDA Data loaded: {len(snapshot.medications)} medications, {len(snapshot.interactions)} interactions")
+    
+    # Update interactions with FDA data
+    interactions = dict(BASE_INTERACTIONS)
+    interactions.update(snapshot.interactions)
+    records = build_records(snapshot.medications)
+    # The snapshot checksum identifies the medications; without one (the
+    # snapshot could not be written) the records themselves are hashed
+    if snapshot.digest:
+        version = catalog_version((), interactions, medications_tag=snapshot.digest)
+    else:
+        version = catalog_version(records, interactions)
+    return MedicationCatalog(records, interactions, render=render_medication_json, version=version)
+
+def build_columnar_catalog() -> MedicationCatalog:
+    """Catalog over the shared columnar file, (re)written from the snapshot only when stale.
+    
+    While the file matches the snapshot, a worker reads just the snapshot
+    header (its checksum is the file's tag) and keeps the mapped file itself
+    as the catalog's medications.
+    """
+    from app.infrastructure.catalog.columnar import open_columnar_catalog
+    
+    def load_columnar_data():
+        snapshot = load_catalog_data(CATALOG_SNAPSHOT_PATH, CATALOG_SOURCE_PATH)
+        records = (Medication(**med).model_dump() | {"rxcui": med.get("rxcui")} for med in snapshot.medications)
+        return records, snapshot.interactions
+    
+    tag = catalog_data_tag(CATALOG_SNAPSHOT_PATH, CATALOG_SOURCE_PATH)
+    medications = open_columnar_catalog(COLUMNAR_CATALOG_PATH, tag, load_columnar_data)
+    interactions = dict(BASE_INTERACTIONS)
+    interactions.update(medications.interactions())
+    print(f"🏥 FDA Data mapped: {len(medications)} medications, {len(interactions)} interactions")
+    return MedicationCatalog(
+        medications,
+        interactions,
+        render=render_medication_json,
+        version=catalog_version((), interactions, medications_tag=tag)
+    )
+
+def as_api_medications(medications) -> List[Medication]:
+    """Materialize catalog entries as response models (no-op for Medication objects)"""
+    return [med if isinstance(med, Medication) else Medication.model_validate(med) for med in medications]
+
+def render_medication_json(medication) -> bytes:
+    """JSON bytes of one catalog entry, exactly as a Medication response would carry it"""
+    return as_api_medications([medication])[0].model_dump_json().encode()
+
+def json_bytes_response(content: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serve rendered JSON as is, skipping response model validation and serialization"""
+    return Response(content=content, media_type="application/json", headers=headers)
+
+def iter_ndjson(catalog: MedicationCatalog, chunk_size: int = 500):
+    """Yield the catalog's rendered medications as NDJSON, chunk_size lines at a time"""
+    lines = []
+    for content in catalog.iter_rendered():
+        lines.append(content)
+        if len(lines) == chunk_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+# The current catalog: medications, interactions, lookup maps and search indexes.
+# It is never mutated; a reload builds a new one and replaces this reference,
+# so request handlers read CATALOG once and use that object throughout.
+with STARTUP_PROFILER.stage("catalog"):
+    CATALOG = build_catalog()
+
+def publish_catalog(catalog: MedicationCatalog):
+    """Make a freshly built catalog current (a single reference assignment)"""
+    global CATALOG
+    CATALOG = catalog
+
+CATALOG_RELOADER = CatalogReloader(
+    build_catalog,
+    publish_catalog,
+    watch_paths=[CATALOG_SOURCE_PATH],
+    # Rewritten by build_catalog when the source is newer; replacing it by hand also reloads
+    generated_paths=[CATALOG_SNAPSHOT_PATH]
+)
+
+# Seconds between checks of the catalog files. With admin reloads enabled every
+# worker watches by default: the worker that handles POST /admin/catalog/reload
+# rewrites the shared snapshot and the others pick it up on their next check.
+CATALOG_WATCH_INTERVAL = float(
+    os.getenv("COGITTO_CATALOG_WATCH_INTERVAL", "5" if os.getenv("COGITTO_ADMIN_TOKEN") else "0")
+)
+
+# Popular searches ("tylenol", "ibuprofen") are answered from this cache
+SEARCH_CACHE = SearchResultCache(
+    max_entries=int(os.getenv("COGITTO_SEARCH_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("COGITTO_SEARCH_CACHE_TTL", "300"))
+)
 
 # Add this AFTER your INTERACTIONS dictionary and BEFORE CHAT_SESSIONS = {}
 
@@ -120,23 +298,38 @@ class CogittoOpenAI:
     """Real OpenAI integration for Cogitto"""
     
     def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        self._api_key = os.getenv("OPENAI_API_KEY")
+        if not self._api_key:
             print("⚠️ Warning: OPENAI_API_KEY not found, using fallback responses")
-            self.client = None
-        else:
-            self.client = AsyncOpenAI(api_key=api_key)
-            print("✅ OpenAI client initialized successfully")
+        self._client = None
         
-        # Enhanced medication knowledge for GPT-4 context
-        self.medication_db = {med.generic_name: {
-            "brand_names": med.brand_names,
-            "uses": med.indications,
-            "warnings": med.warnings,
-            "prescription_required": med.prescription_required,
-            "dosage_form": med.dosage_form,
-            "strength": med.strength
-        } for med in MEDICATIONS}
+        self._medication_db = {}
+        self._medication_db_version = None
+    
+    @property
+    def client(self):
+        """OpenAI client, created on the first chat request (importing openai takes about a second)"""
+        if self._client is None and self._api_key:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self._api_key)
+            print("✅ OpenAI client initialized successfully")
+        return self._client
+    
+    @property
+    def medication_db(self) -> dict:
+        """Enhanced medication knowledge for GPT-4 context (rebuilt when the catalog is reloaded)"""
+        catalog = CATALOG
+        if self._medication_db_version != catalog.version:
+            self._medication_db = {med.generic_name: {
+                "brand_names": med.brand_names,
+                "uses": med.indications,
+                "warnings": med.warnings,
+                "prescription_required": med.prescription_required,
+                "dosage_form": med.dosage_form,
+                "strength": med.strength
+            } for med in catalog}
+            self._medication_db_version = catalog.version
+        return self._medication_db
     
     async def generate_intelligent_response(self, message: str, mentioned_medications: List[str], user_context: dict = None) -> dict:
         """Generate intelligent response using GPT-4 with Cogitto's medical expertise"""
@@ -243,18 +436,15 @@ Format your response clearly with sections like:
         details = []
         
         if len(medications) >= 2:
-            for i, med1 in enumerate(medications):
-                for med2 in medications[i+1:]:
-                    # Check our INTERACTIONS database
-                    interaction = INTERACTIONS.get((med1, med2)) or INTERACTIONS.get((med2, med1))
-                    if interaction:
-                        warnings.append(f"{interaction['severity'].upper()}: {med1} + {med2}")
-                        details.append({
-                            "medications": [med1, med2],
-                            "severity": interaction["severity"],
-                            "description": interaction["description"],
-                            "recommendation": interaction["recommendation"]
-                        })
+            # Check our INTERACTIONS database (most severe first)
+            for med1, med2, interaction in CATALOG.interaction_index.check_regimen(medications):
+                warnings.append(f"{interaction['severity'].upper()}: {med1} + {med2}")
+                details.append({
+                    "medications": [med1, med2],
+                    "severity": interaction["severity"],
+                    "description": interaction["description"],
+                    "recommendation": interaction["recommendation"]
+                })
         
         return {"warnings": warnings, "details": details} if warnings else None
     
@@ -347,7 +537,7 @@ def generate_ai_response(message: str, mentioned_medications: List[str]) -> str:
         med1, med2 = mentioned_medications[0], mentioned_medications[1]
         
         # Check our interaction database
-        interaction = INTERACTIONS.get((med1, med2)) or INTERACTIONS.get((med2, med1))
+        interaction = CATALOG.interaction_index.get(med1, med2)
         
         if interaction:
             if interaction["severity"] == "major":
@@ -363,17 +553,8 @@ def generate_ai_response(message: str, mentioned_medications: List[str]) -> str:
     elif len(mentioned_medications) == 1:
         med_name = mentioned_medications[0]
         
-        # Find medication in our database
-        medication = None
-        for med in MEDICATIONS:
-            if med.generic_name.lower() == med_name.lower():
-                medication = med
-                break
-            # Check brand names
-            for brand in med.brand_names:
-                if brand.lower() == med_name.lower():
-                    medication = med
-                    break
+        # Find medication in our database (generic or brand name)
+        medication = CATALOG.find_by_name(med_name)
         
         if medication:
             response = f"**{medication.generic_name.title()} Information:**\n\n"
@@ -413,7 +594,7 @@ def extract_medications_from_text(text: str) -> List[str]:
     found_medications = []
     
     # Check against our medication database
-    for med in MEDICATIONS:
+    for med in CATALOG:
         # Check generic name
         if med.generic_name.lower() in text_lower:
             found_medications.append(med.generic_name.lower())
@@ -451,14 +632,22 @@ def assess_risk_level(message: str, medications: List[str]) -> str:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    STARTUP_PROFILER.finish()
+    startup = STARTUP_PROFILER.report(top=5)
     print("🚀 Cogitto: Medication AI Assistant started successfully!")
-    print(f"📊 Loaded {len(MEDICATIONS)} medications")
-    print(f"⚡ Tracking {len(INTERACTIONS)} drug interactions")
+    print(f"⏱️ Startup took {startup['total_ms']} ms ({startup['import_total_ms']} ms importing modules): "
+          + ", ".join(f"{stage['name']} {stage['ms']} ms" for stage in startup["stages"]))
+    print(f"📊 Loaded {len(CATALOG)} medications")
+    print(f"⚡ Tracking {len(CATALOG.interaction_index)} drug interactions")
     print("🌐 Server running at: http://localhost:8000")
     print("📖 API Documentation: http://localhost:8000/docs")
     print("🔍 Test search: http://localhost:8000/medications/search?q=acetaminophen")
+    # Optionally poll the catalog files and hot-reload them when they change
+    watcher = asyncio.create_task(CATALOG_RELOADER.watch(CATALOG_WATCH_INTERVAL)) if CATALOG_WATCH_INTERVAL > 0 else None
     yield
     # Shutdown
+    if watcher:
+        watcher.cancel()
     print("👋 Shutting down Cogitto")
 
 # Create FastAPI app (ONLY ONE DEFINITION)
@@ -480,6 +669,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def is_catalog_read(method: str, path: str) -> bool:
+    """GET endpoints whose response depends only on the catalog"""
+    if method != "GET":
+        return False
+    return path == "/stats" or (path.startswith("/medications") and not path.endswith("/cache-stats"))
+
+@app.middleware("http")
+async def catalog_conditional_get(request, call_next):
+    """ETag catalog reads with the catalog version; a matching If-None-Match gets 304 without rendering"""
+    if not is_catalog_read(request.method, request.url.path):
+        return await call_next(request)
+    
+    # Tag with the version seen before the handler runs: if a reload lands in
+    # between, the next revalidation simply misses and gets the new data
+    etag = catalog_etag(CATALOG.version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+    
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
+    return response
+
 # Add these router includes (after your existing app = FastAPI() line)
 app.include_router(auth_router)
 app.include_router(user_medications_router)
@@ -492,7 +705,7 @@ async def root():
         "version": "1.0.0",
         "status": "running",
         "description": "AI-powered medication information, search, and interaction checking",
-        "total_medications": len(MEDICATIONS),
+        "total_medications": len(CATALOG),
         "features": [
             "Medication search by generic or brand name",
             "Drug interaction checking with safety levels", 
@@ -502,9 +715,12 @@ async def root():
         ],
         "endpoints": {
             "search": "/medications/search?q=acetaminophen",
+            "autocomplete": "/medications/autocomplete?q=ace",
             "details": "/medications/1",
             "list_all": "/medications",
+            "export": "/medications/export",
             "interactions": "/interactions/check?med1=warfarin&med2=ibuprofen",
+            "drug_interactions": "/interactions/warfarin",
             "stats": "/stats"
         },
         "documentation": "/docs"
@@ -517,79 +733,193 @@ async def health_check():
         "status": "healthy",
         "service": "cogitto-medication-ai",
         "version": "1.0.0",
-        "medications_loaded": len(MEDICATIONS),
-        "interactions_tracked": len(INTERACTIONS)
+        "medications_loaded": len(CATALOG),
+        "interactions_tracked": len(CATALOG.interaction_index),
+        "catalog_version": CATALOG.version
     }
 
 @app.get("/medications/search", response_model=SearchResult)
 async def search_medications(
-    q: str = Query(..., description="Search query (minimum 2 characters)", min_length=2)
+    q: str = Query(..., description="Search query (minimum 2 characters)", min_length=2),
+    limit: int = Query(20, description="Maximum results per page", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
-    """Search medications by generic name or brand name"""
-    query_lower = q.lower().strip()
-    results = []
+    """Search medications by generic name or brand name, best matches first"""
+    catalog = CATALOG
+    # Search and cache key use the same normalized query, so a cached page is
+    # exactly what searching would return for any spelling that shares its key
+    query = normalize_name(q)
+    cache_key = (query, limit, cursor)
+    cached = SEARCH_CACHE.get(cache_key, catalog.version)
+    if cached is not None:
+        return cached.model_copy(update={"query": q})
     
-    for medication in MEDICATIONS:
-        # Check generic name
-        if query_lower in medication.generic_name.lower():
-            results.append(medication)
-            continue
-        
-        # Check brand names
-        for brand in medication.brand_names:
-            if query_lower in brand.lower():
-                results.append(medication)
-                break
+    results = catalog.search(query)
+    ranked = False
+    match_type = "substring"
+    
+    if not results:
+        # Fall back to typo-tolerant matching ("ibuprofin", "lisinipril")
+        results = catalog.fuzzy_search(query)
+        ranked = True
+        match_type = "fuzzy"
+    
+    try:
+        page = rank_and_paginate(query, results, limit=limit, cursor=cursor, ranked=ranked)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return SearchResult(query=q, results=results, count=len(results))
+    result = SearchResult(
+        query=q,
+        results=as_api_medications(page.items),
+        count=len(page.items),
+        total=page.total,
+        next_cursor=page.next_cursor,
+        match_type=match_type
+    )
+    SEARCH_CACHE.put(cache_key, result, catalog.version)
+    return result
+
+@app.get("/medications/search/cache-stats")
+async def get_search_cache_stats():
+    """Hit, miss and eviction counters of the search result cache"""
+    return SEARCH_CACHE.stats()
+
+@app.get("/medications/autocomplete", response_model=AutocompleteResult)
+async def autocomplete_medications(
+    q: str = Query(..., description="Name prefix typed so far", min_length=1),
+    limit: int = Query(10, description="Maximum number of suggestions", ge=1, le=50)
+):
+    """Suggest medication names completing a prefix (ranked, fixed cost per keystroke)"""
+    suggestions = []
+    for medication, completion in CATALOG.autocomplete(q, limit=limit):
+        suggestions.append(AutocompleteSuggestion(
+            id=medication.id,
+            text=completion.text,
+            generic_name=medication.generic_name,
+            match_type=completion.match_type,
+            exact=completion.exact
+        ))
+    
+    return AutocompleteResult(query=q, suggestions=suggestions, count=len(suggestions))
+
+@app.get("/medications/filter")
+async def filter_medications(
+    prescription_required: Optional[bool] = Query(None, description="Prescription-only (true) or OTC (false)"),
+    dosage_form: Optional[List[str]] = Query(None, description="Dosage form(s), e.g. tablet"),
+    manufacturer: Optional[List[str]] = Query(None, description="Manufacturer name(s)"),
+    data_source: Optional[List[str]] = Query(None, description="Data source(s), e.g. FDA_ORANGE_BOOK"),
+    limit: int = Query(50, description="Maximum medications to return", ge=1, le=500),
+    offset: int = Query(0, description="Number of matches to skip", ge=0)
+):
+    """Filter medications by any combination of facets, with facet counts for the selection"""
+    catalog = CATALOG
+    positions, total, facets = catalog.filter_positions(
+        offset=offset,
+        limit=limit,
+        prescription_required=None if prescription_required is None else [prescription_required],
+        dosage_form=dosage_form,
+        manufacturer=manufacturer,
+        data_source=data_source
+    )
+    summary = json.dumps({"count": len(positions), "total": total, "offset": offset, "facets": facets},
+                         separators=(",", ":"))
+    return json_bytes_response(
+        b'{"medications":' + catalog.rendered_array(positions) + b"," + summary[1:].encode()
+    )
+
+@app.get("/medications/export")
+async def export_medications():
+    """Stream the whole catalog as NDJSON, one medication per line"""
+    # Iterate the catalog current at request time, even if a reload swaps it mid-stream
+    catalog = CATALOG
+    return StreamingResponse(
+        iter_ndjson(catalog),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": 'attachment; filename="medications.ndjson"',
+            "X-Total-Count": str(len(catalog)),
+            "X-Catalog-Version": catalog.version
+        }
+    )
 
 @app.get("/medications/{medication_id}", response_model=Medication)
 async def get_medication(medication_id: str):
     """Get detailed medication information by ID"""
-    for medication in MEDICATIONS:
-        if medication.id == medication_id:
-            return medication
+    content = CATALOG.rendered_json(medication_id)
+    if content is not None:
+        return json_bytes_response(content)
     
     raise HTTPException(status_code=404, detail=f"Medication with ID {medication_id} not found")
 
+@app.post("/medications/batch", response_model=BatchLookupResult)
+async def get_medications_batch(request: BatchLookupRequest):
+    """Get several medications by ID or by generic/brand name in one request"""
+    if not request.ids and not request.names:
+        raise HTTPException(status_code=400, detail="At least one medication id or name is required")
+    if len(request.ids) + len(request.names) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"A batch may contain at most {MAX_BATCH_SIZE} ids and names")
+    
+    medications = []
+    not_found = []
+    seen = set()
+    catalog = CATALOG
+    lookups = [(medication_id, catalog.get) for medication_id in request.ids]
+    lookups += [(name, catalog.find_by_name) for name in request.names]
+    
+    for key, lookup in lookups:
+        medication = lookup(key)
+        if medication is None:
+            not_found.append(key)
+        elif medication.id not in seen:
+            seen.add(medication.id)
+            medications.append(medication)
+    
+    return BatchLookupResult(medications=as_api_medications(medications), not_found=not_found, count=len(medications))
+
 @app.get("/medications", response_model=List[Medication])
-async def list_medications():
-    """List all available medications"""
-    return MEDICATIONS
+async def list_medications(
+    limit: Optional[int] = Query(None, description="Page size (omit for every medication)", ge=1, le=1000),
+    offset: int = Query(0, description="Number of medications to skip", ge=0)
+):
+    """List available medications, optionally one page at a time (see /medications/export for bulk pulls)"""
+    catalog = CATALOG
+    end = len(catalog) if limit is None else min(offset + limit, len(catalog))
+    return json_bytes_response(
+        catalog.rendered_array(range(offset, end)),
+        headers={"X-Total-Count": str(len(catalog))}
+    )
+
+def filtered_list_response(catalog: MedicationCatalog, prescription_required: bool, list_type: str) -> Response:
+    """Prescription/OTC list payload assembled from rendered medications"""
+    positions, _, _ = catalog.filter_positions(prescription_required=[prescription_required])
+    return json_bytes_response(
+        b'{"medications":' + catalog.rendered_array(positions)
+        + f',"count":{len(positions)},"type":"{list_type}"}}'.encode()
+    )
 
 @app.get("/medications/filter/prescription")
 async def get_prescription_medications():
     """Get medications that require prescription"""
-    prescription_meds = [med for med in MEDICATIONS if med.prescription_required]
-    return {
-        "medications": prescription_meds,
-        "count": len(prescription_meds),
-        "type": "prescription_required"
-    }
+    return filtered_list_response(CATALOG, True, "prescription_required")
 
 @app.get("/medications/filter/otc")
 async def get_otc_medications():
     """Get over-the-counter medications"""
-    otc_meds = [med for med in MEDICATIONS if not med.prescription_required]
-    return {
-        "medications": otc_meds,
-        "count": len(otc_meds),
-        "type": "over_the_counter"
-    }
+    return filtered_list_response(CATALOG, False, "over_the_counter")
 
 @app.get("/interactions/check", response_model=InteractionCheck)
 async def check_drug_interactions(
-    med1: str = Query(..., description="First medication (generic name)"),
-    med2: str = Query(..., description="Second medication (generic name)")
+    med1: str = Query(..., description="First medication (generic or brand name)"),
+    med2: str = Query(..., description="Second medication (generic or brand name)")
 ):
     """Check for drug interactions between two medications"""
-    
-    # Normalize medication names
-    medication1 = med1.lower().strip()
-    medication2 = med2.lower().strip()
+    catalog = CATALOG
+    # Same name resolution as check-regimen ("Advil" -> ibuprofen)
+    medication1, medication2 = catalog.resolve_regimen([med1, med2])
     
     # Check for interaction in both directions
-    interaction = INTERACTIONS.get((medication1, medication2)) or INTERACTIONS.get((medication2, medication1))
+    interaction = catalog.interaction_index.get(medication1, medication2)
     
     if interaction:
         return InteractionCheck(
@@ -609,18 +939,127 @@ async def check_drug_interactions(
             disclaimer="⚠️ No known major interactions found in our database. This is not comprehensive - always consult your pharmacist."
         )
 
+@app.post("/interactions/check-regimen", response_model=RegimenCheckResult)
+async def check_regimen_interactions(request: RegimenCheckRequest):
+    """Check a whole medication regimen and return every interacting pair, most severe first"""
+    if len(request.medications) < 2:
+        raise HTTPException(status_code=400, detail="A regimen needs at least two medications")
+    
+    catalog = CATALOG
+    regimen = catalog.resolve_regimen(request.medications)
+    
+    interactions = [
+        RegimenInteraction(
+            medications=[med1, med2],
+            severity=details.get("severity"),
+            description=details.get("description"),
+            recommendation=details.get("recommendation")
+        )
+        for med1, med2, details in catalog.interaction_index.check_regimen(regimen)
+    ]
+    return RegimenCheckResult(
+        medications=list(dict.fromkeys(regimen)),
+        interactions=interactions,
+        count=len(interactions),
+        highest_severity=interactions[0].severity if interactions else None,
+        disclaimer="⚠️ Our interaction database is not comprehensive - always review the full regimen with your pharmacist."
+    )
+
+def screen_catalog_regimens(catalog: MedicationCatalog, regimens: List[List[str]]):
+    """Resolve brand names in every regimen and screen them against the interaction matrix"""
+    return catalog.interaction_matrix.screen_many([catalog.resolve_regimen(regimen) for regimen in regimens])
+
+@app.post("/interactions/screen-regimens", response_model=RegimenScreenResults)
+async def screen_regimens(request: RegimenScreenRequest):
+    """Screen many regimens at once: interacting pair count and highest severity for each"""
+    catalog = CATALOG
+    # Up to 100k names to resolve, the first-use matrix build (SciPy import
+    # included) and the screening itself are all CPU-bound: keep them off the loop
+    summaries = await asyncio.to_thread(screen_catalog_regimens, catalog, request.regimens)
+    results = [
+        RegimenScreenResult(
+            index=index,
+            interacting_pairs=summary.interacting_pairs,
+            highest_severity=summary.highest_severity
+        )
+        for index, summary in enumerate(summaries)
+    ]
+    return RegimenScreenResults(
+        results=results,
+        count=len(results),
+        flagged=sum(1 for result in results if result.interacting_pairs),
+        disclaimer="⚠️ Screening only flags known interactions - review flagged regimens in full with /interactions/check-regimen."
+    )
+
+@app.get("/interactions/{drug}", response_model=DrugInteractionsResult)
+async def get_drug_interactions(drug: str):
+    """Everything a medication is known to interact with, most severe first"""
+    catalog = CATALOG
+    # Accept brand names too ("Coumadin" -> warfarin), resolved as check-regimen does
+    [name] = catalog.resolve_regimen([drug])
+    
+    interactions = [
+        DrugInteraction(
+            medication=partner,
+            severity=details.get("severity"),
+            description=details.get("description"),
+            recommendation=details.get("recommendation")
+        )
+        for partner, details in catalog.interaction_index.ranked_partners(name)
+    ]
+    return DrugInteractionsResult(
+        medication=name,
+        interactions=interactions,
+        count=len(interactions),
+        disclaimer="⚠️ Our interaction database is not comprehensive - always consult your pharmacist or healthcare provider."
+    )
+
 @app.get("/stats")
 async def get_statistics():
-    """Get medication database statistics"""
-    prescription_count = sum(1 for med in MEDICATIONS if med.prescription_required)
-    otc_count = len(MEDICATIONS) - prescription_count
+    """Get medication database statistics (computed when the catalog is built)"""
+    return CATALOG.stats
+
+@app.get("/stats/startup")
+async def get_startup_profile(top: int = Query(25, description="Number of slowest imports to list", ge=1, le=500)):
+    """How long this worker spent importing modules and in each init stage"""
+    return STARTUP_PROFILER.report(top=top)
+
+@app.post("/admin/catalog/reload")
+async def reload_catalog(x_admin_token: Optional[str] = Header(None)):
+    """Rebuild the catalog and its indexes from the data files and swap it in without downtime.
+    
+    This worker rebuilds at once, rewriting the shared snapshot when the
+    source is newer; every other worker reloads from the snapshot within one
+    watch interval. Without file watching a reload could only reach the
+    worker that received it, so it is refused when several workers run.
+    """
+    admin_token = os.getenv("COGITTO_ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="Catalog reload is disabled (COGITTO_ADMIN_TOKEN is not set)")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    if CATALOG_WATCH_INTERVAL <= 0 and int(os.getenv("WEB_CONCURRENCY", "1")) > 1:
+        raise HTTPException(
+            status_code=409,
+            detail="Several workers are running without COGITTO_CATALOG_WATCH_INTERVAL; "
+                   "a reload would only reach this one"
+        )
+    
+    previous_version = CATALOG.version
+    try:
+        catalog = await CATALOG_RELOADER.reload()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Catalog reload failed, keeping the current catalog: {e}")
     
     return {
-        "total_medications": len(MEDICATIONS),
-        "prescription_required": prescription_count,
-        "over_the_counter": otc_count,
-        "known_interactions": len(INTERACTIONS),
-        "dosage_forms": list(set(med.dosage_form for med in MEDICATIONS))
+        "reloaded": True,
+        "changed": catalog.version != previous_version,
+        "previous_version": previous_version,
+        "catalog_version": catalog.version,
+        "medications_loaded": len(catalog),
+        "interactions_tracked": len(catalog.interactions),
+        "duration_ms": CATALOG_RELOADER.last_reload["duration_ms"],
+        "other_workers_reload_within_seconds": CATALOG_WATCH_INTERVAL or None
     }
 
 # Add these new chat endpoints to your existing app (add after your current endpoints)
@@ -847,6 +1286,10 @@ async def test_openai_integration():
             "fallback_available": True
         }
 
+# Everything is imported: stop timing imports here rather than in the lifespan,
+# which never runs if the app is imported without being served
+STARTUP_PROFILER.stop_tracing()
+
 if __name__ == "__main__":
     print("🚀 Starting Cogitto: Medication AI Assistant...")
     uvicorn.run(app, host="127.0.0.1", port=8000, reload=False)
\ No newline at end of file
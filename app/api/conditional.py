@@ -0,0 +1,21 @@
+# app/api/conditional.py
+"""Conditional GET helpers: catalog-version ETags and If-None-Match matching"""
+
+from typing import Optional
+
+# Clients may keep catalog responses but must revalidate them (cheap: 304 while the ETag matches)
+CATALOG_CACHE_CONTROL = "no-cache"
+
+
+def catalog_etag(version: str) -> str:
+    """Strong ETag for any response rendered from this catalog version"""
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
@@ -1,6 +1,6 @@
 # app/api/schemas/medication_schemas.py
 """Schemas for medication-related API responses"""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List
 from ...domain.models.medication import Medication, MedicationForm
 
@@ -45,3 +45,23 @@ class MedicationInsightsResponse(BaseModel):
             cogitto_recommendation=service_result["cogitto_recommendation"],
             disclaimer=service_result["disclaimer"]
         )
+
+class MedicationBatchRequest(BaseModel):
+    """Several medications to resolve in one request"""
+    ids: List[str] = Field(default_factory=list, description="Medication ids")
+    names: List[str] = Field(default_factory=list, description="Generic or brand names")
+
+class MedicationBatchResponse(BaseModel):
+    """Resolved medications plus the ids/names that matched nothing"""
+    medications: List[MedicationResponse]
+    not_found: List[str]
+    count: int
+    
+    @classmethod
+    def from_service_result(cls, service_result: dict) -> "MedicationBatchResponse":
+        medications = [MedicationResponse.from_domain(med) for med in service_result["medications"]]
+        return cls(
+            medications=medications,
+            not_found=service_result["not_found"],
+            count=len(medications)
+        )
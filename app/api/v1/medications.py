@@ -1,34 +1,118 @@
 # app/api/v1/medications.py
 """API endpoints for medication-related operations"""
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List
+import os
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from typing import List, Optional
 from ...domain.services.medication_service import CogittoMedicationService
 from ...infrastructure.repositories.in_memory_medication_repository import InMemoryMedicationRepository
-from ..schemas.medication_schemas import MedicationResponse, MedicationInsightsResponse
+from ...infrastructure.repositories.sqlite_medication_repository import SQLiteMedicationRepository
+from ...infrastructure.repositories.postgres_medication_repository import PostgresMedicationRepository
+from ...infrastructure.search.result_cache import SearchResultCache
+from ..conditional import CATALOG_CACHE_CONTROL, catalog_etag, etag_matches
+from ..schemas.medication_schemas import (
+    MedicationResponse,
+    MedicationInsightsResponse,
+    MedicationBatchRequest,
+    MedicationBatchResponse
+)
 
 router = APIRouter()
 
-# Dependency injection for Cogitto
-def get_cogitto_service() -> CogittoMedicationService:
-    repository = InMemoryMedicationRepository()
-    return CogittoMedicationService(repository)
+def build_cogitto_service() -> CogittoMedicationService:
+    """Create the repository (with its indexes warmed) and the service on top of it"""
+    sqlite_path = os.getenv("COGITTO_CATALOG_SQLITE")
+    if os.getenv("COGITTO_CATALOG_BACKEND", "").lower() == "postgres":
+        # Indexed full-text/trigram search over the medications table
+        repository = PostgresMedicationRepository()
+    elif sqlite_path:
+        # Large catalogs live in an embedded SQLite/FTS5 file instead of Python objects
+        repository = SQLiteMedicationRepository(sqlite_path)
+        if not len(repository):
+            print(f"⚠️ {sqlite_path} has no medications - build it with scripts/build_sqlite_catalog.py")
+    else:
+        repository = InMemoryMedicationRepository()
+    search_cache = SearchResultCache(
+        max_entries=int(os.getenv("COGITTO_SEARCH_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("COGITTO_SEARCH_CACHE_TTL", "300"))
+    )
+    return CogittoMedicationService(repository, search_cache=search_cache)
 
-@router.get("/medications/search", response_model=List[MedicationResponse])
+# Dependency injection for Cogitto - one service per app, shared read-only by all requests
+def get_cogitto_service(request: Request) -> CogittoMedicationService:
+    service = getattr(request.app.state, "cogitto_service", None)
+    if service is None:
+        # The app was started without its lifespan (e.g. router mounted elsewhere)
+        service = build_cogitto_service()
+        request.app.state.cogitto_service = service
+    return service
+
+def catalog_conditional_get(
+    request: Request,
+    response: Response,
+    service: CogittoMedicationService = Depends(get_cogitto_service)
+):
+    """Tag catalog reads with the catalog version and answer a matching If-None-Match with 304"""
+    version = service.repository.catalog_version
+    if version is None:
+        # PostgreSQL-backed catalogs do not track a version
+        return
+    etag = catalog_etag(version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
+
+@router.get(
+    "/medications/search",
+    response_model=List[MedicationResponse],
+    dependencies=[Depends(catalog_conditional_get)]
+)
 async def search_medications(
+    response: Response,
     q: str = Query(..., description="Search query", min_length=2),
+    limit: int = Query(20, description="Maximum results per page", ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor of the previous page"),
     service: CogittoMedicationService = Depends(get_cogitto_service)
 ):
-    """Search medications with Cogitto's intelligent matching"""
+    """Search medications with Cogitto's intelligent matching, best matches first"""
     try:
-        medications = await service.search_medications(q)
-        return [MedicationResponse.from_domain(med) for med in medications]
+        page = await service.search_medications_page(q, limit=limit, cursor=cursor)
+        response.headers["X-Total-Count"] = str(page.total)
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return [MedicationResponse.from_domain(med) for med in page.items]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
-@router.get("/medications/{medication_id}", response_model=MedicationResponse)
+@router.get("/medications/search/cache-stats")
+async def get_search_cache_stats(service: CogittoMedicationService = Depends(get_cogitto_service)):
+    """Hit, miss and eviction counters of the search result cache"""
+    if service.search_cache is None or service.repository.catalog_version is None:
+        return {"enabled": False}
+    return {"enabled": True, **service.search_cache.stats()}
+
+@router.post("/medications/batch", response_model=MedicationBatchResponse)
+async def get_medications_batch(
+    request: MedicationBatchRequest,
+    service: CogittoMedicationService = Depends(get_cogitto_service)
+):
+    """Get several medications by id or name in one round trip"""
+    try:
+        result = await service.get_medications_batch(request.ids, request.names)
+        return MedicationBatchResponse.from_service_result(result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch lookup failed: {str(e)}")
+
+@router.get(
+    "/medications/{medication_id}",
+    response_model=MedicationResponse,
+    dependencies=[Depends(catalog_conditional_get)]
+)
 async def get_medication(
     medication_id: str,
     service: CogittoMedicationService = Depends(get_cogitto_service)
@@ -44,7 +128,11 @@ async def get_medication(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get medication: {str(e)}")
 
-@router.get("/medications/{medication_id}/insights", response_model=MedicationInsightsResponse)
+@router.get(
+    "/medications/{medication_id}/insights",
+    response_model=MedicationInsightsResponse,
+    dependencies=[Depends(catalog_conditional_get)]
+)
 async def get_medication_insights(
     medication_id: str,
     service: CogittoMedicationService = Depends(get_cogitto_service)
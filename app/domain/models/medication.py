@@ -12,8 +12,9 @@ class MedicationForm(Enum):
     INJECTION = "injection"
     TOPICAL = "topical"
     INHALER = "inhaler"
+    UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class Medication:
     """Core medication entity for Cogitto"""
     id: str
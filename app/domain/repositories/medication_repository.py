@@ -1,7 +1,7 @@
 # /app/domain/repositories/medication_repository.py
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..models.medication import Medication
 
 class MedicationRepository(ABC):
@@ -18,3 +18,25 @@ class MedicationRepository(ABC):
     @abstractmethod
     async def search(self, query: str) -> List[Medication]:
         pass
+    
+    async def find_by_ids(self, medication_ids: List[str]) -> Dict[str, Medication]:
+        """Medications for several ids at once; missing ids are left out"""
+        found = {}
+        for medication_id in medication_ids:
+            medication = await self.find_by_id(medication_id)
+            if medication:
+                found[medication_id] = medication
+        return found
+    
+    async def find_by_name(self, name: str) -> Optional[Medication]:
+        """Find medication by generic or brand name; defaults to generic names only"""
+        return await self.find_by_generic_name(name)
+    
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """Identifies the current catalog contents; None when unknown (search results are then not cached)"""
+        return None
+    
+    async def fuzzy_search(self, query: str, limit: int = 10) -> List[Medication]:
+        """Typo-tolerant search; repositories without a fuzzy index return nothing"""
+        return []
@@ -2,20 +2,72 @@
 from typing import List, Optional
 from ..models.medication import Medication
 from ..repositories.medication_repository import MedicationRepository
+from .search_ranking import DEFAULT_PAGE_SIZE, SearchPage, rank_all, rank_and_paginate
+
+MAX_BATCH_SIZE = 100
 
 class CogittoMedicationService:
     """Cogitto's core medication business logic"""
     
-    def __init__(self, repository: MedicationRepository):
+    def __init__(self, repository: MedicationRepository, search_cache=None):
         self.repository = repository
+        # Optional SearchResultCache; pages are keyed by query, limit and cursor
+        self.search_cache = search_cache
+    
+    async def search_medications(self, query: str, limit: Optional[int] = None,
+                                 cursor: Optional[str] = None) -> List[Medication]:
+        """Intelligent medication search with validation, best matches first.
+        
+        Returns every match unless a limit is given; paged callers use
+        search_medications_page.
+        """
+        if limit is not None:
+            page = await self.search_medications_page(query, limit=limit, cursor=cursor)
+            return page.items
+        
+        query = self._validate_query(query)
+        results = await self.repository.search(query)
+        if results:
+            return rank_all(query, results)
+        return await self.repository.fuzzy_search(query)
+    
+    async def search_medications_page(self, query: str, limit: int = DEFAULT_PAGE_SIZE,
+                                      cursor: Optional[str] = None) -> SearchPage:
+        """Relevance-ranked page of search results with a cursor to the next page"""
+        query = self._validate_query(query)
+        
+        version = self.repository.catalog_version
+        if self.search_cache is None or version is None:
+            # Without a catalog version, cached pages could never be invalidated
+            return await self._search_page(query, limit, cursor)
+        
+        key = (query, limit, cursor)
+        page = self.search_cache.get(key, version)
+        if page is None:
+            page = await self._search_page(query, limit, cursor)
+            self.search_cache.put(key, page, version)
+        return page
     
-    async def search_medications(self, query: str) -> List[Medication]:
-        """Intelligent medication search with validation"""
-        if not query or len(query.strip()) < 2:
+    @staticmethod
+    def _validate_query(query: str) -> str:
+        # Searched and cache-keyed in one form, so equivalent spellings
+        # ("Lisinopril", " lisinopril  ") share one cached page
+        query = " ".join((query or "").lower().split())
+        if len(query) < 2:
             raise ValueError("Search query must be at least 2 characters")
+        return query
+    
+    async def _search_page(self, query: str, limit: int, cursor: Optional[str]) -> SearchPage:
+        results = await self.repository.search(query)
+        if results:
+            return rank_and_paginate(query, results, limit=limit, cursor=cursor)
         
-        results = await self.repository.search(query.strip())
-        return results
+        # Nothing contains the query - it may be misspelled ("ibuprofin").
+        # Fuzzy matches already come ordered by edit distance.
+        results = await self.repository.fuzzy_search(query)
+        page = rank_and_paginate(query, results, limit=limit, cursor=cursor, ranked=True)
+        page.match_type = "fuzzy"
+        return page
     
     async def get_medication_by_id(self, medication_id: str) -> Optional[Medication]:
         """Get medication by ID with validation"""
@@ -24,6 +76,36 @@ class CogittoMedicationService:
         
         return await self.repository.find_by_id(medication_id)
     
+    async def get_medications_batch(self, medication_ids: List[str], names: List[str]) -> dict:
+        """Resolve several ids and names in one call, keeping request order"""
+        if not medication_ids and not names:
+            raise ValueError("At least one medication id or name is required")
+        if len(medication_ids) + len(names) > MAX_BATCH_SIZE:
+            raise ValueError(f"A batch may contain at most {MAX_BATCH_SIZE} ids and names")
+        
+        medications = []
+        not_found = []
+        seen = set()
+        
+        by_id = await self.repository.find_by_ids(medication_ids)
+        for medication_id in medication_ids:
+            medication = by_id.get(medication_id)
+            if medication is None:
+                not_found.append(medication_id)
+            elif medication.id not in seen:
+                seen.add(medication.id)
+                medications.append(medication)
+        
+        for name in names:
+            medication = await self.repository.find_by_name(name)
+            if medication is None:
+                not_found.append(name)
+            elif medication.id not in seen:
+                seen.add(medication.id)
+                medications.append(medication)
+        
+        return {"medications": medications, "not_found": not_found}
+    
     async def get_medication_insights(self, medication_id: str) -> dict:
         """Get comprehensive medication insights - Cogitto's enhanced view"""
         medication = await self.get_medication_by_id(medication_id)
@@ -0,0 +1,109 @@
+# app/domain/services/search_ranking.py
+"""Relevance ranking and cursor pagination for Cogitto's medication search"""
+
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Match tiers, best first
+EXACT = 0
+PREFIX = 1
+SUBSTRING = 2
+BRAND_EXACT = 3
+BRAND_PREFIX = 4
+BRAND = 5
+OTHER = 6
+
+
+def relevance_key(query: str, generic_name: str, brand_names: Sequence[str]) -> tuple:
+    """Sort key: exact, then prefix, then substring on the generic name, then brand matches"""
+    query_lower = query.lower().strip()
+    generic_lower = generic_name.lower()
+
+    if generic_lower == query_lower:
+        tier = EXACT
+    elif generic_lower.startswith(query_lower):
+        tier = PREFIX
+    elif query_lower in generic_lower:
+        tier = SUBSTRING
+    else:
+        tier = OTHER
+        for brand in brand_names:
+            brand_lower = brand.lower()
+            if brand_lower == query_lower:
+                tier = BRAND_EXACT
+                break
+            if brand_lower.startswith(query_lower):
+                tier = min(tier, BRAND_PREFIX)
+            elif query_lower in brand_lower:
+                tier = min(tier, BRAND)
+
+    # Shorter names are closer matches within a tier
+    return (tier, len(generic_lower))
+
+
+def rank_all(query: str, medications: Sequence[Any]) -> List[Any]:
+    """Every match ordered by relevance, catalog order breaking ties"""
+    return sorted(medications, key=lambda med: relevance_key(query, med.generic_name, med.brand_names))
+
+
+@dataclass
+class SearchPage:
+    """One page of ranked search results"""
+    items: List[Any]
+    total: int
+    offset: int
+    next_cursor: Optional[str] = None
+    match_type: str = "substring"
+
+
+def encode_cursor(offset: int) -> str:
+    """Opaque, URL-safe cursor for the page starting at offset"""
+    payload = json.dumps({"o": offset}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Offset encoded in a cursor; raises ValueError for malformed cursors"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = int(json.loads(base64.urlsafe_b64decode(padded))["o"])
+    except Exception:
+        raise ValueError("Invalid search cursor")
+    if offset < 0:
+        raise ValueError("Invalid search cursor")
+    return offset
+
+
+def rank_and_paginate(query: str, medications: Sequence[Any], limit: int = DEFAULT_PAGE_SIZE,
+                      cursor: Optional[str] = None, ranked: bool = False) -> SearchPage:
+    """Order matches by relevance and cut out one page.
+
+    ``medications`` are expected in catalog order, which breaks ties so pages
+    stay stable between requests. Only ``offset + limit`` results are ever
+    fully ordered. Pass ``ranked=True`` for input that is already in order.
+    """
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    offset = decode_cursor(cursor)
+    total = len(medications)
+    end = offset + limit
+
+    if ranked:
+        top = list(medications[:end])
+    else:
+        keyed = (
+            (relevance_key(query, med.generic_name, med.brand_names), position, med)
+            for position, med in enumerate(medications)
+        )
+        top = [entry[2] for entry in heapq.nsmallest(end, keyed, key=lambda entry: entry[:2])]
+
+    next_cursor = encode_cursor(end) if end < total else None
+    return SearchPage(items=top[offset:end], total=total, offset=offset, next_cursor=next_cursor)
@@ -0,0 +1,26 @@
+# app/infrastructure/catalog/base_interactions.py
+"""Curated drug interactions served alongside the FDA interaction data"""
+
+# The catalog merges the FDA interactions over these
+BASE_INTERACTIONS = {
+    ("warfarin", "ibuprofen"): {
+        "severity": "major",
+        "description": "Increased bleeding risk due to antiplatelet effects",
+        "recommendation": "Avoid combination. Use acetaminophen instead for pain relief."
+    },
+    ("warfarin", "acetaminophen"): {
+        "severity": "moderate",
+        "description": "High doses may enhance warfarin effect",
+        "recommendation": "Monitor INR if using >2g/day acetaminophen"
+    },
+    ("lisinopril", "ibuprofen"): {
+        "severity": "moderate",
+        "description": "Reduced effectiveness of ACE inhibitor",
+        "recommendation": "Monitor blood pressure. Consider acetaminophen alternative."
+    },
+    ("metformin", "atorvastatin"): {
+        "severity": "minor",
+        "description": "Rare reports of muscle problems",
+        "recommendation": "Monitor for muscle pain or weakness"
+    }
+}
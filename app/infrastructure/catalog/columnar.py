@@ -0,0 +1,303 @@
+# app/infrastructure/catalog/columnar.py
+"""Read-only, memory-mapped columnar medication catalog shared across workers"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+MAGIC = b"COGCOL"
+FORMAT_VERSION = 2
+_PREAMBLE = struct.Struct("<6sHI")  # magic, format version, header length
+_ALIGNMENT = 8
+
+# Column kinds
+STR = "str"
+BOOL = "bool"
+STR_LIST = "str_list"
+
+# Columns of an FDA catalog record (see data/fda_data_integration.py)
+MEDICATION_FIELDS: Dict[str, str] = {
+    "id": STR,
+    "generic_name": STR,
+    "brand_names": STR_LIST,
+    "dosage_form": STR,
+    "strength": STR,
+    "prescription_required": BOOL,
+    "indications": STR_LIST,
+    "warnings": STR_LIST,
+    "manufacturer": STR,
+    "data_source": STR,
+    "rxcui": STR,
+}
+
+_NONE_ID = 0xFFFFFFFF
+_NONE_BOOL = 2
+
+Interactions = Mapping[Tuple[str, str], Dict[str, Any]]
+
+
+class ColumnarCatalogError(ValueError):
+    """The columnar catalog file is missing, corrupt or incompatible"""
+
+
+def write_columnar_catalog(path: str, records: Iterable[Mapping[str, Any]],
+                           fields: Mapping[str, str] = MEDICATION_FIELDS, tag: str = "",
+                           interactions: Optional[Interactions] = None) -> None:
+    """Write records as a columnar file: one deduplicated string table plus per-field arrays.
+
+    The interaction pairs that go with the records are stored alongside as
+    one JSON section, so a worker mapping a current file needs nothing else.
+
+    The file is written to a temporary name and renamed into place, so
+    workers that already mapped an older file keep reading it undisturbed.
+    """
+    records = list(records)
+    string_ids: Dict[str, int] = {}
+    string_data = bytearray()
+    string_offsets = array("Q", [0])
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return _NONE_ID
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = len(string_ids)
+            string_ids[value] = string_id
+            string_data.extend(value.encode("utf-8"))
+            string_offsets.append(len(string_data))
+        return string_id
+
+    columns = []
+    for name, kind in fields.items():
+        if kind == STR:
+            columns.append((name, kind, [array("I", (intern(record.get(name)) for record in records))]))
+        elif kind == BOOL:
+            values = (_NONE_BOOL if record.get(name) is None else int(bool(record.get(name))) for record in records)
+            columns.append((name, kind, [array("B", values)]))
+        elif kind == STR_LIST:
+            offsets = array("Q", [0])
+            ids = array("I")
+            for record in records:
+                ids.extend(intern(value) for value in (record.get(name) or ()))
+                offsets.append(len(ids))
+            columns.append((name, kind, [offsets, ids]))
+        else:
+            raise ValueError(f"Unknown column kind: {kind}")
+
+    # Lay out sections after the header, each aligned for zero-copy casts
+    sections: List[bytes] = []
+    layout: Dict[str, Any] = {"count": len(records), "tag": tag, "byteorder": sys.byteorder, "fields": []}
+
+    def add_section(data: bytes) -> List[int]:
+        sections.append(data)
+        return [len(sections) - 1, len(data)]
+
+    layout["string_offsets"] = add_section(string_offsets.tobytes())
+    layout["string_data"] = add_section(bytes(string_data))
+    layout["interactions"] = add_section(json.dumps(
+        [[first, second, details] for (first, second), details in (interactions or {}).items()]
+    ).encode())
+    for name, kind, arrays in columns:
+        layout["fields"].append({
+            "name": name,
+            "kind": kind,
+            "sections": [add_section(column.tobytes()) for column in arrays],
+        })
+
+    # Resolve section numbers to absolute offsets. Offsets depend on the header
+    # size and vice versa, so grow the reserved header space until it fits.
+    start = 0
+    while True:
+        offsets = []
+        position = start
+        for data in sections:
+            offsets.append(position)
+            position = _align(position + len(data))
+        header = json.dumps(_resolve_layout(layout, offsets)).encode()
+        needed = _align(_PREAMBLE.size + len(header))
+        if needed <= start:
+            break
+        start = needed
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".columnar-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            handle.write(header)
+            for offset, data in zip(offsets, sections):
+                handle.write(b"\0" * (offset - handle.tell()))
+                handle.write(data)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class MedicationView:
+    """Lightweight handle on one record; fields are decoded from the mapping on access"""
+
+    __slots__ = ("_catalog", "_index")
+
+    def __init__(self, catalog: "ColumnarCatalog", index: int):
+        self._catalog = catalog
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._catalog.value(self._index, name)
+        except KeyError:
+            raise AttributeError(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize every field (for building response models)"""
+        return {name: self._catalog.value(self._index, name) for name in self._catalog.field_names}
+
+    def __repr__(self) -> str:
+        return f"MedicationView({self._index}, id={self.id!r})"
+
+
+class ColumnarCatalog(Sequence):
+    """Sequence of ``MedicationView`` over an mmap-ed columnar file.
+
+    The file is mapped read-only, so every worker process on the host shares
+    the same physical pages through the OS page cache. Python objects are
+    only created for the fields a caller actually reads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "rb") as handle:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ColumnarCatalogError(f"Cannot map columnar catalog {path}: {e}")
+
+        buffer = memoryview(self._mmap)
+        try:
+            magic, version, header_length = _PREAMBLE.unpack_from(buffer)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ColumnarCatalogError(f"{path} is not a columnar catalog (format {FORMAT_VERSION})")
+            layout = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+        except (struct.error, json.JSONDecodeError) as e:
+            raise ColumnarCatalogError(f"Columnar catalog header is invalid: {e}")
+        if layout["byteorder"] != sys.byteorder:
+            raise ColumnarCatalogError("Columnar catalog was written on a host with another byte order")
+
+        def section(ref, fmt=None):
+            offset, length = ref
+            view = buffer[offset:offset + length]
+            return view.cast(fmt) if fmt else view
+
+        self._buffer = buffer
+        self.count: int = layout["count"]
+        self.tag: str = layout["tag"]
+        self._string_offsets = section(layout["string_offsets"], "Q")
+        self._string_data = section(layout["string_data"])
+        self._interactions = section(layout["interactions"])
+        self._columns: Dict[str, tuple] = {}
+        for field in layout["fields"]:
+            kind = field["kind"]
+            if kind == STR:
+                arrays = (section(field["sections"][0], "I"),)
+            elif kind == BOOL:
+                arrays = (section(field["sections"][0], "B"),)
+            else:
+                arrays = (section(field["sections"][0], "Q"), section(field["sections"][1], "I"))
+            self._columns[field["name"]] = (kind, arrays)
+        self.field_names = list(self._columns)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [MedicationView(self, i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("catalog index out of range")
+        return MedicationView(self, index)
+
+    def value(self, index: int, name: str) -> Any:
+        """Decode one field of one record"""
+        kind, arrays = self._columns[name]
+        if kind == STR:
+            return self._string(arrays[0][index])
+        if kind == BOOL:
+            flag = arrays[0][index]
+            return None if flag == _NONE_BOOL else bool(flag)
+        offsets, ids = arrays
+        return [self._string(ids[i]) for i in range(offsets[index], offsets[index + 1])]
+
+    def interactions(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Decode the interaction pairs stored with the catalog"""
+        return {(first, second): details for first, second, details in json.loads(bytes(self._interactions))}
+
+    def close(self):
+        """Release the mapping (views must not be used afterwards)"""
+        for _, arrays in self._columns.values():
+            for column in arrays:
+                column.release()
+        self._columns.clear()
+        self._string_offsets.release()
+        self._string_data.release()
+        self._interactions.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == _NONE_ID:
+            return None
+        start = self._string_offsets[string_id]
+        end = self._string_offsets[string_id + 1]
+        return str(self._string_data[start:end], "utf-8")
+
+
+def open_columnar_catalog(path: str, tag: str,
+                          load: Callable[[], Tuple[Iterable[Mapping[str, Any]], Interactions]],
+                          fields: Mapping[str, str] = MEDICATION_FIELDS) -> ColumnarCatalog:
+    """Map the catalog at path, (re)writing it first when it is missing or its tag differs.
+
+    ``load`` returns the records and interactions to write; it is only
+    called when the file has to be rewritten.
+    """
+    try:
+        catalog = ColumnarCatalog(path)
+        if catalog.tag == tag:
+            return catalog
+        catalog.close()
+    except ColumnarCatalogError:
+        pass
+    records, interactions = load()
+    write_columnar_catalog(path, records, fields=fields, tag=tag, interactions=interactions)
+    return ColumnarCatalog(path)
+
+
+def _resolve_layout(layout: Dict[str, Any], offsets: List[int]) -> Dict[str, Any]:
+    """Copy of layout with [section number, length] refs turned into [offset, length]"""
+    def resolve(ref):
+        return [offsets[ref[0]], ref[1]]
+
+    resolved = dict(layout)
+    resolved["string_offsets"] = resolve(layout["string_offsets"])
+    resolved["string_data"] = resolve(layout["string_data"])
+    resolved["interactions"] = resolve(layout["interactions"])
+    resolved["fields"] = [
+        {**field, "sections": [resolve(ref) for ref in field["sections"]]}
+        for field in layout["fields"]
+    ]
+    return resolved
+
+
+def _align(position: int) -> int:
+    return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
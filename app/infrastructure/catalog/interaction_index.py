@@ -0,0 +1,120 @@
+# app/infrastructure/catalog/interaction_index.py
+"""Drug interaction lookups by unordered pair and by drug"""
+
+from typing import Any, Container, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Most severe first; unknown severities sort last
+SEVERITY_RANK = {"contraindicated": 0, "major": 1, "moderate": 2, "minor": 3}
+
+
+def severity_rank(severity: Optional[str]) -> int:
+    return SEVERITY_RANK.get((severity or "").lower(), len(SEVERITY_RANK))
+
+
+def canonical_pair(first: str, second: str) -> Tuple[str, str]:
+    """Order-independent key for a drug pair (names compared case-insensitively)"""
+    first = first.lower().strip()
+    second = second.lower().strip()
+    return (first, second) if first <= second else (second, first)
+
+
+def brand_aliases(names: Iterable[Sequence[str]], known_drugs: Container[str] = ()) -> Dict[str, str]:
+    """Lowercased brand name -> generic name, so "Advil" is checked as ibuprofen.
+
+    ``names`` holds ``[generic_name, *brand_names]`` per medication. Generic
+    names always stand for themselves. A brand shared by several products
+    resolves to the first generic listed in ``known_drugs`` (the drugs with
+    interaction data), or else to the first generic.
+    """
+    generics = []
+    candidates: Dict[str, List[str]] = {}
+    for generic_name, *brand_names in names:
+        generic = generic_name.lower().strip()
+        generics.append(generic)
+        for brand in brand_names:
+            candidates.setdefault(brand.lower().strip(), []).append(generic)
+
+    aliases: Dict[str, str] = {}
+    generic_set = set(generics)
+    for brand, options in candidates.items():
+        if brand in generic_set:
+            continue
+        aliases[brand] = next((generic for generic in options if generic in known_drugs), options[0])
+    return aliases
+
+
+def resolve_regimen(names: Iterable[str], aliases: Mapping[str, str]) -> List[str]:
+    """Interaction-table names for a regimen: lowercased, brand names replaced by their generic"""
+    regimen = []
+    for name in names:
+        name = name.lower().strip()
+        regimen.append(aliases.get(name, name))
+    return regimen
+
+
+class InteractionIndex:
+    """Interaction pairs keyed canonically, plus each drug's interaction partners.
+
+    Built once from the ``(drug, drug) -> details`` mapping, so a pair needs
+    one lookup whichever order it is asked in, and "what does warfarin
+    interact with" is a single adjacency lookup instead of a scan of every
+    pair. If both orders of a pair are listed, the first one wins.
+    """
+
+    def __init__(self, interactions: Mapping[Tuple[str, str], Dict[str, Any]]):
+        self.pairs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.adjacency: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (first, second), details in interactions.items():
+            pair = canonical_pair(first, second)
+            if pair in self.pairs:
+                continue
+            self.pairs[pair] = details
+            self.adjacency.setdefault(pair[0], {})[pair[1]] = details
+            self.adjacency.setdefault(pair[1], {})[pair[0]] = details
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def get(self, first: str, second: str) -> Optional[Dict[str, Any]]:
+        """Interaction between two drugs, in either order"""
+        return self.pairs.get(canonical_pair(first, second))
+
+    def partners(self, drug: str) -> Dict[str, Dict[str, Any]]:
+        """Drugs that interact with drug, mapped to the interaction details"""
+        return self.adjacency.get(drug.lower().strip(), {})
+
+    def ranked_partners(self, drug: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Interaction partners of drug, most severe first, then by name"""
+        return sorted(
+            self.partners(drug).items(),
+            key=lambda item: (severity_rank(item[1].get("severity")), item[0])
+        )
+
+    def check_regimen(self, drugs: Iterable[str]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Every interacting pair within a regimen as (drug, drug, details), most severe first.
+
+        Each drug's partners are intersected with the regimen, walking the
+        smaller of the two, so the cost follows the number of interactions
+        present rather than the number of drug pairs. Pairs are named in
+        regimen order; ties in severity keep that order too.
+        """
+        positions: Dict[str, int] = {}
+        for drug in drugs:
+            positions.setdefault(drug.lower().strip(), len(positions))
+
+        found = []
+        for drug, position in positions.items():
+            partners = self.adjacency.get(drug)
+            if not partners:
+                continue
+            if len(partners) < len(positions):
+                candidates = [partner for partner in partners if partner in positions]
+            else:
+                candidates = [partner for partner in positions if partner in partners]
+            for partner in candidates:
+                # Report each pair once, from its earlier drug (also skips self-pairs)
+                if positions[partner] > position:
+                    found.append((drug, partner, partners[partner]))
+
+        found.sort(key=lambda item: (severity_rank(item[2].get("severity")), positions[item[0]], positions[item[1]]))
+        return found
@@ -0,0 +1,149 @@
+# app/infrastructure/catalog/interaction_matrix.py
+"""Integer-coded sparse interaction severity matrix for bulk screening"""
+
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .interaction_index import InteractionIndex
+
+# Severity levels stored in the matrix; 0 means "no interaction"
+SEVERITY_LEVELS = {"contraindicated": 5, "major": 4, "moderate": 3, "minor": 2}
+UNKNOWN_SEVERITY_LEVEL = 1
+_LEVEL_NAMES = {level: name for name, level in SEVERITY_LEVELS.items()}
+
+
+def severity_level(severity: Optional[str]) -> int:
+    return SEVERITY_LEVELS.get((severity or "").lower(), UNKNOWN_SEVERITY_LEVEL)
+
+
+def severity_name(level: int) -> Optional[str]:
+    """Severity for a matrix level (None for 0, "unknown" for unrecognized severities)"""
+    if not level:
+        return None
+    return _LEVEL_NAMES.get(level, "unknown")
+
+
+def _sparse_modules():
+    """NumPy and scipy.sparse, imported only when a vectorized matrix is built"""
+    try:
+        import numpy
+        from scipy import sparse
+    except ImportError:  # optional; screening falls back to pure Python
+        return None
+    return numpy, sparse
+
+
+class ScreeningSummary(NamedTuple):
+    """Result of screening one regimen in bulk"""
+    interacting_pairs: int
+    highest_level: int
+
+    @property
+    def highest_severity(self) -> Optional[str]:
+        return severity_name(self.highest_level)
+
+
+class InteractionMatrix:
+    """Drugs coded 0..n-1 and interactions as a symmetric CSR matrix of severity levels.
+
+    The CSR arrays (indptr, indices, data) are always built. With NumPy and
+    SciPy installed they also back ``matrix``, a ``scipy.sparse.csr_matrix``,
+    and ``screen_many`` screens thousands of regimens with a few sparse
+    matrix products. Without them, or with ``vectorized=False``, the same
+    arrays are walked in Python. NumPy and SciPy are imported by the first
+    vectorized matrix, not when this module is loaded.
+    """
+
+    def __init__(self, index: InteractionIndex, vectorized: bool = True):
+        self.names: List[str] = sorted(index.adjacency)
+        self.codes: Dict[str, int] = {name: code for code, name in enumerate(self.names)}
+
+        self.indptr = array("q", [0])
+        self.indices = array("q")
+        self.data = array("b")
+        for name in self.names:
+            row = sorted(
+                (self.codes[partner], severity_level(details.get("severity")))
+                for partner, details in index.adjacency[name].items()
+            )
+            for code, level in row:
+                self.indices.append(code)
+                self.data.append(level)
+            self.indptr.append(len(self.indices))
+
+        self.matrix = None
+        self._level_matrices = []
+        modules = _sparse_modules() if vectorized else None
+        if modules is not None:
+            np, sparse = self._np, self._sparse = modules
+            size = len(self.names)
+            self.matrix = sparse.csr_matrix(
+                (np.frombuffer(self.data, dtype=np.int8),
+                 np.frombuffer(self.indices, dtype=np.int64),
+                 np.frombuffer(self.indptr, dtype=np.int64)),
+                shape=(size, size)
+            )
+            # One 0/1 matrix per severity level present, lowest first
+            self._level_matrices = [
+                (level, (self.matrix == level).astype(np.int32))
+                for level in sorted(set(self.data))
+            ]
+
+    @property
+    def vectorized(self) -> bool:
+        return self.matrix is not None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def encode(self, drugs: Iterable[str]) -> List[int]:
+        """Codes of the drugs that have known interactions, deduplicated, in order"""
+        codes = {}
+        for drug in drugs:
+            code = self.codes.get(drug.lower().strip())
+            if code is not None:
+                codes.setdefault(code, None)
+        return list(codes)
+
+    def screen(self, drugs: Iterable[str]) -> List[Tuple[str, str, int]]:
+        """Interacting pairs in one regimen as (drug, drug, level), most severe first"""
+        codes = self.encode(drugs)
+        positions = {code: position for position, code in enumerate(codes)}
+        found = []
+        for code in codes:
+            for offset in range(self.indptr[code], self.indptr[code + 1]):
+                other = self.indices[offset]
+                if positions.get(other, -1) > positions[code]:
+                    found.append((code, other, self.data[offset]))
+        found.sort(key=lambda item: (-item[2], positions[item[0]], positions[item[1]]))
+        return [(self.names[first], self.names[second], level) for first, second, level in found]
+
+    def screen_many(self, regimens: Sequence[Iterable[str]]) -> List[ScreeningSummary]:
+        """Interacting pair count and highest severity level for every regimen"""
+        if not self.vectorized:
+            summaries = []
+            for regimen in regimens:
+                pairs = self.screen(regimen)
+                summaries.append(ScreeningSummary(len(pairs), pairs[0][2] if pairs else 0))
+            return summaries
+
+        np, sparse = self._np, self._sparse
+        # Regimens as a 0/1 (regimen x drug) matrix R. For each severity level L
+        # with 0/1 matrix B_L, row r of (R @ B_L) * R counts, for every drug in
+        # regimen r, its level-L partners inside the same regimen: twice the pairs.
+        rows, columns = [], []
+        for row, regimen in enumerate(regimens):
+            for code in self.encode(regimen):
+                rows.append(row)
+                columns.append(code)
+        regimen_matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(regimens), len(self.names))
+        )
+        pair_counts = np.zeros(len(regimens), dtype=np.int64)
+        highest = np.zeros(len(regimens), dtype=np.int64)
+        for level, level_matrix in self._level_matrices:
+            hits = np.asarray((regimen_matrix @ level_matrix).multiply(regimen_matrix).sum(axis=1)).ravel()
+            pair_counts += hits // 2
+            highest[hits > 0] = level
+        return [ScreeningSummary(int(count), int(level)) for count, level in zip(pair_counts, highest)]
@@ -0,0 +1,242 @@
+# app/infrastructure/catalog/medication_catalog.py
+"""Read-only medication catalog with every derived lookup structure"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from ..search.facet_index import FacetIndex
+from .interaction_index import InteractionIndex, brand_aliases, resolve_regimen
+from .interaction_matrix import InteractionMatrix
+from ..search.fuzzy_index import FuzzyIndex
+from ..search.ngram_index import NGramIndex
+from ..search.prefix_index import Completion, PrefixIndex
+
+M = TypeVar("M")
+
+# Facets available for combined filtering; missing fields count as None
+FACETS = ("prescription_required", "dosage_form", "manufacturer", "data_source")
+
+
+class MedicationCatalog(Generic[M]):
+    """A loaded list of medications plus the indexes built from it.
+
+    Works with any medication type exposing ``id``, ``generic_name`` and
+    ``brand_names`` (the domain dataclass and the pydantic model in app.py).
+    Everything is built once in the constructor (the bulk-screening
+    interaction matrix on first access) and never mutated afterwards, so one
+    catalog can be shared by all requests, and a reload can build a
+    replacement on the side and publish it with a single assignment.
+
+    A list of medications is copied; any other sequence (such as a
+    memory-mapped ColumnarCatalog) is kept as is, and the lookup maps hold
+    catalog positions rather than medication objects. Pass ``version`` when
+    the caller already knows the content hash, to skip hashing every record.
+
+    With ``render``, response JSON is rendered on first use and kept in a
+    bounded LRU of ``render_cache_size`` medications, so building a catalog
+    never renders the whole thing and each worker only holds what it serves.
+    """
+
+    def __init__(self, medications: Sequence[M],
+                 interactions: Optional[Mapping[Tuple[str, str], Dict[str, Any]]] = None,
+                 render: Optional[Callable[[M], bytes]] = None,
+                 version: Optional[str] = None, render_cache_size: int = 4096):
+        if isinstance(medications, Sequence) and not isinstance(medications, list):
+            self.medications: Sequence[M] = medications
+        else:
+            self.medications = list(medications)
+        self.interactions: Dict[Tuple[str, str], Dict[str, Any]] = dict(interactions or {})
+        self.interaction_index = InteractionIndex(self.interactions)
+        self.version = version or catalog_version(self.medications, self.interactions)
+
+        # O(1) detail lookups. The first entry wins on duplicates, like the
+        # linear scans this replaces, and generic names win over brand names.
+        self._position_by_id: Dict[str, int] = {}
+        self._position_by_generic_name: Dict[str, int] = {}
+        names = []
+        for position, medication in enumerate(self.medications):
+            generic_name, brand_names = medication.generic_name, medication.brand_names
+            self._position_by_id.setdefault(medication.id, position)
+            self._position_by_generic_name.setdefault(generic_name.lower().strip(), position)
+            names.append([generic_name, *brand_names])
+        self._position_by_name: Dict[str, int] = dict(self._position_by_generic_name)
+        for position, (_, *brand_names) in enumerate(names):
+            for brand in brand_names:
+                self._position_by_name.setdefault(brand.lower().strip(), position)
+
+        # Brand -> generic for regimen checks, shared with the nightly screening job
+        self.brand_aliases = brand_aliases(names, self.interaction_index.adjacency)
+
+        self.search_index = NGramIndex.from_names(names)
+        self.fuzzy_index = FuzzyIndex(names)
+        self.autocomplete_index = PrefixIndex((generic_name, brand_names) for generic_name, *brand_names in names)
+        self.facet_index = FacetIndex(self.medications, {
+            facet: (lambda med, field=facet: getattr(med, field, None)) for facet in FACETS
+        })
+
+        self.stats = self._statistics()
+
+        # Response bytes by position, rendered on demand (render turns a
+        # medication into its JSON); a reload builds a new catalog and so
+        # starts with an empty cache.
+        self._render = render
+        self._render_cache_size = render_cache_size
+        self._rendered: "OrderedDict[int, bytes]" = OrderedDict()
+        self._rendered_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.medications)
+
+    @functools.cached_property
+    def interaction_matrix(self) -> InteractionMatrix:
+        """Sparse severity matrix for bulk regimen screening, built on first use"""
+        return InteractionMatrix(self.interaction_index)
+
+    def __iter__(self):
+        return iter(self.medications)
+
+    def _statistics(self) -> Dict[str, Any]:
+        """Catalog summary for /stats, from the facet bitsets and interaction pairs"""
+        facets = self.facet_index.counts()
+        prescription = facets["prescription_required"]
+        severities = Counter(
+            str(details.get("severity", "unknown")).lower() for details in self.interaction_index.pairs.values()
+        )
+        return {
+            "catalog_version": self.version,
+            "total_medications": len(self.medications),
+            "prescription_required": prescription.get("True", 0),
+            "over_the_counter": prescription.get("False", 0),
+            "dosage_forms": sorted(facets["dosage_form"]),
+            "dosage_form_counts": facets["dosage_form"],
+            "data_source_counts": facets["data_source"],
+            "manufacturers": len(facets["manufacturer"]),
+            "known_interactions": len(self.interaction_index),
+            "interaction_severity_counts": dict(severities.most_common()),
+        }
+
+    def get(self, medication_id: str) -> Optional[M]:
+        """Medication with this id"""
+        return self._at(self._position_by_id.get(medication_id))
+
+    def find_by_generic_name(self, name: str) -> Optional[M]:
+        """Medication whose generic name equals name (case-insensitive)"""
+        return self._at(self._position_by_generic_name.get(name.lower().strip()))
+
+    def find_by_name(self, name: str) -> Optional[M]:
+        """Medication whose generic or brand name equals name (case-insensitive)"""
+        return self._at(self._position_by_name.get(name.lower().strip()))
+
+    def resolve_regimen(self, names: Iterable[str]) -> List[str]:
+        """Interaction-table names for a regimen; brand names resolve to their generic ("Advil" -> ibuprofen)"""
+        return resolve_regimen(names, self.brand_aliases)
+
+    def _at(self, position: Optional[int]) -> Optional[M]:
+        return None if position is None else self.medications[position]
+
+    def search(self, query: str) -> List[M]:
+        """Medications with a generic or brand name containing query, in catalog order"""
+        return [self.medications[position] for position in self.search_index.search(query)]
+
+    def fuzzy_search(self, query: str, limit: int = 10) -> List[M]:
+        """Medications with a name within a couple of typos of query, closest first"""
+        return [self.medications[match.position] for match in self.fuzzy_index.lookup(query, limit=limit)]
+
+    def filter(self, offset: int = 0, limit: Optional[int] = None,
+               **selections: Optional[Iterable]) -> Tuple[List[M], int, Dict[str, Dict[str, int]]]:
+        """Medications matching every given facet, with the total and facet counts of the selection"""
+        positions, total, counts = self.filter_positions(offset=offset, limit=limit, **selections)
+        return [self.medications[p] for p in positions], total, counts
+
+    def filter_positions(self, offset: int = 0, limit: Optional[int] = None,
+                         **selections: Optional[Iterable]) -> Tuple[List[int], int, Dict[str, Dict[str, int]]]:
+        """Like filter, but catalog positions instead of medications"""
+        bits = self.facet_index.select(selections)
+        positions = FacetIndex.positions(bits, offset=offset, limit=limit)
+        return positions, bits.bit_count(), self.facet_index.counts(bits)
+
+    def rendered_at(self, position: int) -> bytes:
+        """Rendered JSON of the medication at position, from the cache when it is there"""
+        with self._rendered_lock:
+            content = self._rendered.get(position)
+            if content is not None:
+                self._rendered.move_to_end(position)
+                return content
+        content = self._render(self.medications[position])
+        with self._rendered_lock:
+            self._rendered[position] = content
+            if len(self._rendered) > self._render_cache_size:
+                self._rendered.popitem(last=False)
+        return content
+
+    def rendered_json(self, medication_id: str) -> Optional[bytes]:
+        """Rendered JSON of the medication with this id"""
+        position = self._position_by_id.get(medication_id)
+        return None if position is None else self.rendered_at(position)
+
+    def rendered_array(self, positions: Iterable[int]) -> bytes:
+        """JSON array of the rendered medications at positions.
+
+        Like iter_rendered, cached entries are reused but nothing new is
+        cached: a 1000-item page would otherwise evict a quarter of the
+        cache and take the lock once per medication.
+        """
+        positions = list(positions)
+        with self._rendered_lock:
+            cached = [self._rendered.get(position) for position in positions]
+        return b"[" + b",".join(
+            content if content is not None else self._render(self.medications[position])
+            for position, content in zip(positions, cached)
+        ) + b"]"
+
+    def iter_rendered(self) -> Iterator[bytes]:
+        """Rendered JSON of every medication in order, for bulk exports.
+
+        Cached entries are reused, but nothing new is cached, so a full
+        export does not evict the entries that single lookups keep hot.
+        """
+        for position, medication in enumerate(self.medications):
+            content = self._rendered.get(position)
+            yield content if content is not None else self._render(medication)
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Tuple[M, Completion]]:
+        """Ranked name completions for prefix, paired with their medication"""
+        return [
+            (self.medications[completion.position], completion)
+            for completion in self.autocomplete_index.complete(prefix, limit=limit)
+        ]
+
+
+def catalog_version(medications: Sequence,
+                    interactions: Optional[Mapping[Tuple[str, str], Dict[str, Any]]] = None,
+                    medications_tag: Optional[str] = None) -> str:
+    """Content hash identifying one state of the catalog.
+
+    ``medications_tag`` (a checksum of the medication data, such as a
+    snapshot's) stands in for hashing every medication.
+    """
+    digest = hashlib.sha256()
+    if medications_tag is not None:
+        digest.update(medications_tag.encode())
+        digest.update(b"\n")
+        medications = ()
+    for medication in medications:
+        if hasattr(medication, "model_dump"):
+            fields = medication.model_dump()
+        elif hasattr(medication, "to_dict"):
+            fields = medication.to_dict()
+        elif dataclasses.is_dataclass(medication):
+            fields = dataclasses.asdict(medication)
+        else:
+            fields = vars(medication)
+        digest.update(json.dumps(fields, sort_keys=True, default=str).encode())
+        digest.update(b"\n")
+    for pair, details in sorted((interactions or {}).items()):
+        digest.update(json.dumps([list(pair), details], sort_keys=True, default=str).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
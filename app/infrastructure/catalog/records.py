@@ -0,0 +1,99 @@
+# app/infrastructure/catalog/records.py
+"""Compact in-memory medication records for catalog storage"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+
+class StringPool:
+    """Shares one object per distinct string or string tuple within a catalog build.
+
+    FDA product lists repeat the same dosage forms, manufacturers, data
+    sources and warning texts across thousands of entries. Keeping the pool
+    per catalog (instead of ``sys.intern``) lets a reloaded catalog release
+    the strings of the one it replaced.
+    """
+
+    def __init__(self):
+        self._values: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self._values.setdefault(value, value)
+
+    def intern_tuple(self, values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        """Immutable, shared tuple of interned strings (empty for None)"""
+        items = tuple(self.intern(value) for value in (values or ()))
+        return self._values.setdefault(items, items)
+
+
+class MedicationRecord:
+    """One catalog entry: fixed slots, tuples for lists, pooled strings.
+
+    Records carry the same attributes as app.py's ``Medication`` model and
+    are converted to it only when a response is built.
+    """
+
+    __slots__ = (
+        "id", "generic_name", "brand_names", "dosage_form", "strength", "prescription_required",
+        "indications", "warnings", "manufacturer", "data_source", "rxcui",
+    )
+
+    def __init__(self, id: str, generic_name: str, brand_names: Tuple[str, ...], dosage_form: str,
+                 strength: str, prescription_required: bool, indications: Tuple[str, ...],
+                 warnings: Tuple[str, ...], manufacturer: Optional[str] = None,
+                 data_source: Optional[str] = None, rxcui: Optional[str] = None):
+        self.id = id
+        self.generic_name = generic_name
+        self.brand_names = brand_names
+        self.dosage_form = dosage_form
+        self.strength = strength
+        self.prescription_required = prescription_required
+        self.indications = indications
+        self.warnings = warnings
+        self.manufacturer = manufacturer
+        self.data_source = data_source
+        self.rxcui = rxcui
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], pool: StringPool) -> "MedicationRecord":
+        """Build a record from a raw FDA catalog entry, sharing repeated values through pool"""
+        return cls(
+            id=pool.intern(str(data["id"])),
+            generic_name=pool.intern(data["generic_name"]),
+            brand_names=pool.intern_tuple(data["brand_names"]),
+            dosage_form=pool.intern(data["dosage_form"]),
+            strength=pool.intern(data["strength"]),
+            prescription_required=bool(data["prescription_required"]),
+            indications=pool.intern_tuple(data["indications"]),
+            warnings=pool.intern_tuple(data["warnings"]),
+            manufacturer=pool.intern(data.get("manufacturer")),
+            data_source=pool.intern(data.get("data_source")),
+            rxcui=pool.intern(data.get("rxcui")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain field values, lists as lists (for building response models)"""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        for name in ("brand_names", "indications", "warnings"):
+            fields[name] = list(fields[name])
+        return fields
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MedicationRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"MedicationRecord(id={self.id!r}, generic_name={self.generic_name!r})"
+
+
+def build_records(entries: Iterable[Mapping[str, Any]]) -> List[MedicationRecord]:
+    """Records for raw catalog entries, all sharing one string pool"""
+    pool = StringPool()
+    return [MedicationRecord.from_dict(entry, pool) for entry in entries]
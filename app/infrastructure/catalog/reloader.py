@@ -0,0 +1,84 @@
+# app/infrastructure/catalog/reloader.py
+"""Background catalog rebuilds published with one reference assignment"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CatalogReloader(Generic[T]):
+    """Rebuilds the catalog off the event loop and swaps it in atomically.
+
+    ``build`` returns a complete catalog (data, lookup maps and indexes) and
+    runs in a worker thread; ``publish`` then makes it current with a single
+    assignment. Requests keep using whichever catalog they picked up, so
+    readers never lock and never see a half-built catalog. Only reloads are
+    serialized against each other. If a build fails, the current catalog
+    stays in place.
+
+    ``generated_paths`` are watched like ``watch_paths`` but may also be
+    rewritten by ``build`` itself (the snapshot, rebuilt when its source is
+    newer), so their times are taken after the build: a reload never
+    triggers another one.
+    """
+
+    def __init__(self, build: Callable[[], T], publish: Callable[[T], None],
+                 watch_paths: Sequence[str] = (), generated_paths: Sequence[str] = ()):
+        self._build = build
+        self._publish = publish
+        self.watch_paths = list(watch_paths)
+        self.generated_paths = list(generated_paths)
+        self._lock = asyncio.Lock()
+        self._mtimes = self._current_mtimes()
+        self.reload_count = 0
+        self.last_reload: Optional[Dict[str, Any]] = None
+
+    async def reload(self) -> T:
+        """Build a new catalog in a worker thread and publish it"""
+        async with self._lock:
+            source_mtimes = self._mtimes_of(self.watch_paths)
+            started = time.perf_counter()
+            catalog = await asyncio.to_thread(self._build)
+            self._publish(catalog)
+            # Record what was loaded; source edits made during the build trigger another reload
+            self._mtimes = source_mtimes + self._mtimes_of(self.generated_paths)
+            self.reload_count += 1
+            self.last_reload = {
+                "completed_at": time.time(),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+            return catalog
+
+    def sources_changed(self) -> bool:
+        """Whether a watched file was modified, created or removed since the last load"""
+        return self._current_mtimes() != self._mtimes
+
+    async def watch(self, interval: float = 5.0):
+        """Poll the watched files and reload when one of them changes (runs until cancelled)"""
+        while True:
+            await asyncio.sleep(interval)
+            if not self.sources_changed():
+                continue
+            try:
+                await self.reload()
+                print(f"🔄 Catalog reloaded after a change to {', '.join(self.watch_paths + self.generated_paths)}")
+            except Exception as e:
+                # Keep serving the current catalog and retry on the next change
+                self._mtimes = self._current_mtimes()
+                print(f"⚠️ Catalog reload failed, keeping the current catalog: {e}")
+
+    def _current_mtimes(self) -> Tuple[Optional[float], ...]:
+        return self._mtimes_of(self.watch_paths) + self._mtimes_of(self.generated_paths)
+
+    @staticmethod
+    def _mtimes_of(paths: Sequence[str]) -> Tuple[Optional[float], ...]:
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
@@ -0,0 +1,179 @@
+# app/infrastructure/catalog/snapshot.py
+"""Versioned binary snapshot of the medication catalog and interaction data"""
+
+import hashlib
+import io
+import os
+import pickle
+import runpy
+import struct
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+MAGIC = b"COGCAT"
+FORMAT_VERSION = 1
+
+# magic, format version, payload length, sha256 of the payload
+_HEADER = struct.Struct(">6sHQ32s")
+
+
+class SnapshotError(ValueError):
+    """The snapshot file is missing, corrupt or from an unsupported format"""
+
+
+@dataclass
+class CatalogSnapshot:
+    """Raw catalog data as the app loads it: medication dicts and interaction pairs"""
+    medications: List[Dict[str, Any]]
+    interactions: Dict[Tuple[str, str], Dict[str, Any]]
+    created_at: str
+    source: str = ""
+    # sha256 of the snapshot payload (hex); empty when the data was never written
+    digest: str = ""
+
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """Unpickler that only rebuilds builtin containers and scalars"""
+
+    def find_class(self, module, name):
+        raise SnapshotError(f"Snapshot references a disallowed type: {module}.{name}")
+
+
+def write_snapshot(path: str, medications: List[Dict[str, Any]],
+                   interactions: Dict[Tuple[str, str], Dict[str, Any]], source: str = "") -> CatalogSnapshot:
+    """Write a snapshot atomically (temp file + rename), so readers never see half a file"""
+    snapshot = CatalogSnapshot(
+        medications=[dict(med) for med in medications],
+        interactions={tuple(pair): dict(details) for pair, details in interactions.items()},
+        created_at=datetime.utcnow().isoformat(),
+        source=source
+    )
+    payload = pickle.dumps(
+        {
+            "medications": snapshot.medications,
+            "interactions": snapshot.interactions,
+            "created_at": snapshot.created_at,
+            "source": snapshot.source,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    digest = hashlib.sha256(payload).digest()
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(payload), digest)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            handle.write(payload)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    snapshot.digest = digest.hex()
+    return snapshot
+
+
+def read_snapshot(path: str) -> CatalogSnapshot:
+    """Read and verify a snapshot written by write_snapshot"""
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except OSError as e:
+        raise SnapshotError(f"Cannot read catalog snapshot {path}: {e}")
+
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Catalog snapshot is truncated")
+    magic, version, length, digest = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("Not a Cogitto catalog snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported catalog snapshot format {version} (expected {FORMAT_VERSION})")
+
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length or hashlib.sha256(payload).digest() != digest:
+        raise SnapshotError("Catalog snapshot checksum mismatch")
+
+    try:
+        content = _PlainDataUnpickler(io.BytesIO(payload)).load()
+    except SnapshotError:
+        raise
+    except Exception as e:
+        raise SnapshotError(f"Catalog snapshot payload is invalid: {e}")
+
+    return CatalogSnapshot(
+        medications=content["medications"],
+        interactions=content["interactions"],
+        created_at=content["created_at"],
+        source=content.get("source", ""),
+        digest=digest.hex()
+    )
+
+
+def read_snapshot_tag(path: str) -> str:
+    """Payload checksum from the snapshot header, without reading the payload"""
+    try:
+        with open(path, "rb") as handle:
+            header = handle.read(_HEADER.size)
+    except OSError as e:
+        raise SnapshotError(f"Cannot read catalog snapshot {path}: {e}")
+
+    if len(header) < _HEADER.size:
+        raise SnapshotError("Catalog snapshot is truncated")
+    magic, version, _, digest = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise SnapshotError("Not a Cogitto catalog snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported catalog snapshot format {version} (expected {FORMAT_VERSION})")
+    return digest.hex()
+
+
+def catalog_data_tag(snapshot_path: str, source_path: str) -> str:
+    """Tag of the current catalog data, rebuilding the snapshot first when the source is newer"""
+    try:
+        if not os.path.exists(source_path) or os.path.getmtime(snapshot_path) >= os.path.getmtime(source_path):
+            return read_snapshot_tag(snapshot_path)
+    except (OSError, SnapshotError):
+        pass
+    load_catalog_data(snapshot_path, source_path)
+    return read_snapshot_tag(snapshot_path)
+
+
+def generated_from(snapshot: CatalogSnapshot, source_path: str) -> bool:
+    """Whether snapshot was written from source_path (snapshots that predate the source field count as such)"""
+    if not snapshot.source:
+        return True
+    return os.path.normpath(os.path.abspath(snapshot.source)) == os.path.normpath(os.path.abspath(source_path))
+
+
+def load_catalog_data(snapshot_path: str, source_path: str) -> CatalogSnapshot:
+    """Catalog data from the snapshot, rebuilding it from the Python source when needed.
+
+    The snapshot is used when it exists and is at least as new as the
+    generated source file. Otherwise the source is evaluated once (the old
+    startup path) and a fresh snapshot is written for the next process.
+    Snapshots generated from other data (such as a synthetic catalog) are
+    never replaced, however old they are.
+    """
+    try:
+        if not os.path.exists(source_path) or os.path.getmtime(snapshot_path) >= os.path.getmtime(source_path):
+            return read_snapshot(snapshot_path)
+        snapshot = read_snapshot(snapshot_path)
+        if not generated_from(snapshot, source_path):
+            return snapshot
+    except (OSError, SnapshotError) as e:
+        if os.path.exists(snapshot_path):
+            print(f"⚠️ Ignoring catalog snapshot: {e}")
+
+    namespace = runpy.run_path(source_path)
+    medications = namespace["FDA_MEDICATIONS_DATA"]
+    interactions = namespace.get("FDA_INTERACTIONS", {})
+    try:
+        return write_snapshot(snapshot_path, medications, interactions, source=source_path)
+    except OSError as e:
+        print(f"⚠️ Could not write catalog snapshot: {e}")
+        return CatalogSnapshot(medications, interactions, datetime.utcnow().isoformat(), source_path)
@@ -0,0 +1,18 @@
+# app/infrastructure/database/schemas/regimen_screening_schema.sql
+-- Nightly regimen screening results (scripts/screen_user_regimens.py)
+-- One row per run for each user whose active medications interact
+CREATE TABLE IF NOT EXISTS regimen_screening_results (
+    id SERIAL PRIMARY KEY,
+    run_id UUID NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    medication_count INTEGER NOT NULL,
+    interacting_pairs INTEGER NOT NULL,
+    highest_severity VARCHAR(20),
+    findings JSONB NOT NULL DEFAULT '[]',
+    screened_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    UNIQUE(run_id, user_id)
+);
+
+-- Latest findings for a user
+CREATE INDEX IF NOT EXISTS idx_regimen_screening_user ON regimen_screening_results(user_id, screened_at DESC);
@@ -0,0 +1,149 @@
+# app/infrastructure/diagnostics/startup_profiler.py
+"""Per-module import times and per-stage init times for worker startup"""
+
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Loaders created once per module, so wrapping their exec_module is safe
+_PER_MODULE_LOADERS = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+    importlib.machinery.ExtensionFileLoader,
+)
+
+
+@dataclass
+class ImportTiming:
+    """Time spent executing one module body; cumulative includes its own imports"""
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+    nested: bool = False
+
+
+@dataclass
+class StageTiming:
+    """Wall time of one named initialization step"""
+    name: str
+    seconds: float
+
+
+class StartupProfiler:
+    """Records how long startup spends importing modules and running init stages.
+
+    While tracing, a meta path finder times each module's execution (like
+    ``python -X importtime``, but collected in-process so the app can serve
+    the report). Stages are timed with ``with profiler.stage("catalog"):``.
+    Call ``stop_tracing()`` as soon as the importing is done, even if the app
+    never starts serving, and ``finish()`` once the app is ready.
+    """
+
+    def __init__(self, trace_imports: bool = True):
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.imports: List[ImportTiming] = []
+        self.stages: List[StageTiming] = []
+        self._local = threading.local()
+        self._finder = _ImportTimer(self) if trace_imports else None
+        if self._finder:
+            sys.meta_path.insert(0, self._finder)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one startup stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append(StageTiming(name, time.perf_counter() - started))
+
+    def stop_tracing(self):
+        """Remove the import finder from sys.meta_path; imports after this are not timed"""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def finish(self):
+        """Stop tracing imports and fix the total startup time"""
+        self.stop_tracing()
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """Stage times plus the slowest module imports (by self time)"""
+        end = self.finished if self.finished is not None else time.perf_counter()
+        # Nested imports are already part of the cumulative time of their importer
+        import_total = sum(timing.cumulative_seconds for timing in self.imports if not timing.nested)
+        slowest = sorted(self.imports, key=lambda timing: timing.self_seconds, reverse=True)[:top]
+        return {
+            "total_ms": _ms(end - self.started),
+            "import_total_ms": _ms(import_total),
+            "modules_imported": len(self.imports),
+            "stages": [{"name": stage.name, "ms": _ms(stage.seconds)} for stage in self.stages],
+            "slowest_imports": [
+                {"module": timing.module, "self_ms": _ms(timing.self_seconds), "cumulative_ms": _ms(timing.cumulative_seconds)}
+                for timing in slowest
+            ],
+        }
+
+    def _timed(self, name: str, exec_module):
+        def exec_module_timed(module):
+            stack = self._stack()
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - started
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.imports.append(ImportTiming(name, elapsed - children, elapsed, nested=bool(stack)))
+        return exec_module_timed
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Finds specs through the remaining finders and wraps their loaders with a timer"""
+
+    def __init__(self, profiler: StartupProfiler):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "searching", False) or not self._outermost():
+            return None
+        self._local.searching = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if isinstance(finder, _ImportTimer) or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.searching = False
+
+        if spec is not None and isinstance(spec.loader, _PER_MODULE_LOADERS):
+            spec.loader.exec_module = self._profiler._timed(fullname, spec.loader.exec_module)
+        return spec
+
+    def _outermost(self) -> bool:
+        # With several profilers live only the newest times imports; the
+        # others would search the same finders again for every import
+        return next((finder for finder in sys.meta_path if isinstance(finder, _ImportTimer)), None) is self
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
@@ -4,7 +4,6 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
-import pandas as pd
 from urllib.parse import quote
 
 class FDAOrangeBookClient:
@@ -1,6 +1,7 @@
 # app/infrastructure/repositories/in_memory_medication_repository.py
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ...domain.models.medication import Medication, MedicationForm
+from ..catalog.medication_catalog import MedicationCatalog
 
 class InMemoryMedicationRepository:
     """In-memory repository for Cogitto - rapid prototyping"""
@@ -69,40 +70,43 @@ class InMemoryMedicationRepository:
                 warnings=["Long-term use concerns", "Magnesium deficiency", "B12 deficiency"]
             )
         ]
+        
+        # Id/name maps and search indexes, built once
+        self.catalog = MedicationCatalog(self.medications)
+    
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """Content hash of the loaded catalog"""
+        return self.catalog.version
     
     async def find_by_id(self, medication_id: str) -> Optional[Medication]:
         """Find medication by ID"""
-        for med in self.medications:
-            if med.id == medication_id:
-                return med
-        return None
+        return self.catalog.get(medication_id)
     
     async def find_by_generic_name(self, name: str) -> Optional[Medication]:
         """Find medication by generic name"""
-        name_lower = name.lower()
-        for med in self.medications:
-            if med.generic_name.lower() == name_lower:
-                return med
-        return None
+        return self.catalog.find_by_generic_name(name)
+    
+    async def find_by_ids(self, medication_ids: List[str]) -> Dict[str, Medication]:
+        """Find several medications by ID"""
+        found = {}
+        for medication_id in medication_ids:
+            medication = self.catalog.get(medication_id)
+            if medication is not None:
+                found[medication_id] = medication
+        return found
+    
+    async def find_by_name(self, name: str) -> Optional[Medication]:
+        """Find medication by generic or brand name"""
+        return self.catalog.find_by_name(name)
     
     async def search(self, query: str) -> List[Medication]:
         """Search medications by name (generic or brand)"""
-        query_lower = query.lower()
-        results = []
-        
-        for med in self.medications:
-            # Check generic name
-            if query_lower in med.generic_name.lower():
-                results.append(med)
-                continue
-            
-            # Check brand names
-            for brand in med.brand_names:
-                if query_lower in brand.lower():
-                    results.append(med)
-                    break
-        
-        return results
+        return self.catalog.search(query)
+    
+    async def fuzzy_search(self, query: str, limit: int = 10) -> List[Medication]:
+        """Search medications by name, tolerating misspellings"""
+        return self.catalog.fuzzy_search(query, limit=limit)
     
     async def get_all(self) -> List[Medication]:
         """Get all medications"""
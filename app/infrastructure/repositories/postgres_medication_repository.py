@@ -0,0 +1,153 @@
+# app/infrastructure/repositories/postgres_medication_repository.py
+"""PostgreSQL-backed repository using full-text and trigram indexes"""
+
+import uuid
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from ...domain.models.medication import Medication, MedicationForm
+from ...domain.repositories.medication_repository import MedicationRepository
+from ..database.connection import DatabaseConnection, db_connection
+
+_COLUMNS = "id, generic_name, brand_names, dosage_form, strength, prescription_required, indications, warnings"
+
+# Exactly the expression idx_medications_brand_names_trgm is built on
+BRAND_TEXT = "medication_brand_text(brand_names)"
+
+# Statements are module constants so every call sends the same SQL text and
+# asyncpg reuses the prepared statement it cached for the connection.
+FIND_BY_ID = text(f"SELECT {_COLUMNS} FROM medications WHERE id = :id")
+
+FIND_BY_IDS = text(f"SELECT {_COLUMNS} FROM medications WHERE id = ANY(:ids)")
+
+FIND_BY_GENERIC_NAME = text(f"""
+    SELECT {_COLUMNS} FROM medications
+    WHERE lower(generic_name) = lower(:name)
+    ORDER BY created_at
+    LIMIT 1
+""")
+
+# Generic names first, then exact brand names. The ILIKE on the brand text
+# lets the trigram index narrow the rows the per-brand comparison checks.
+FIND_BY_NAME = text(f"""
+    SELECT {_COLUMNS} FROM medications
+    WHERE lower(generic_name) = lower(:name)
+       OR ({BRAND_TEXT} ILIKE :pattern
+           AND lower(:name) = ANY(SELECT lower(brand) FROM unnest(brand_names) AS brand))
+    ORDER BY lower(generic_name) = lower(:name) DESC, created_at
+    LIMIT 1
+""")
+
+# Full-text hits on search_vector (GIN) ranked with ts_rank, plus substring
+# matches on names served by the pg_trgm GIN indexes.
+SEARCH = text(f"""
+    SELECT {_COLUMNS}
+    FROM medications, plainto_tsquery('english', :query) AS query
+    WHERE search_vector @@ query
+       OR generic_name ILIKE :pattern
+       OR {BRAND_TEXT} ILIKE :pattern
+    ORDER BY ts_rank(search_vector, query) DESC,
+             similarity(generic_name, :query) DESC,
+             generic_name
+    LIMIT :limit
+""")
+
+# Typo-tolerant lookup: trigram similarity on generic and brand names
+FUZZY_SEARCH = text(f"""
+    SELECT {_COLUMNS}
+    FROM medications
+    WHERE generic_name % :query OR {BRAND_TEXT} % :query
+    ORDER BY greatest(similarity(generic_name, :query),
+                      similarity({BRAND_TEXT}, :query)) DESC,
+             generic_name
+    LIMIT :limit
+""")
+
+
+class PostgresMedicationRepository(MedicationRepository):
+    """Medication catalog served from the ``medications`` table.
+
+    Search uses the ``search_vector`` GIN index and the pg_trgm indexes from
+    scripts/cogitto_schema.sql (scripts/migrate_medication_search.sql adds
+    them to existing databases), so cost follows the number of matches
+    instead of the catalog size. Every query returns at most ``max_results`` rows.
+    The table can change at any time, so no catalog version is reported and
+    the service does not cache search results over it.
+    """
+
+    def __init__(self, database: DatabaseConnection = db_connection, max_results: int = 100):
+        self.database = database
+        self.max_results = max_results
+
+    async def find_by_id(self, medication_id: str) -> Optional[Medication]:
+        """Find medication by ID (medications.id is a UUID)"""
+        try:
+            medication_uuid = uuid.UUID(medication_id)
+        except (ValueError, AttributeError, TypeError):
+            return None
+        rows = await self._fetch(FIND_BY_ID, {"id": medication_uuid})
+        return self._to_domain(rows[0]) if rows else None
+
+    async def find_by_ids(self, medication_ids: List[str]) -> Dict[str, Medication]:
+        """Find several medications by ID in one query"""
+        by_uuid = {}
+        for medication_id in medication_ids[:self.max_results]:
+            try:
+                by_uuid[uuid.UUID(medication_id)] = medication_id
+            except (ValueError, AttributeError, TypeError):
+                continue
+        if not by_uuid:
+            return {}
+        rows = await self._fetch(FIND_BY_IDS, {"ids": list(by_uuid)})
+        return {by_uuid[row["id"]]: self._to_domain(row) for row in rows}
+
+    async def find_by_generic_name(self, name: str) -> Optional[Medication]:
+        """Find medication by generic name (case-insensitive)"""
+        rows = await self._fetch(FIND_BY_GENERIC_NAME, {"name": name.strip()})
+        return self._to_domain(rows[0]) if rows else None
+
+    async def find_by_name(self, name: str) -> Optional[Medication]:
+        """Find medication by generic or brand name (case-insensitive), generic names first"""
+        name = name.strip()
+        rows = await self._fetch(FIND_BY_NAME, {"name": name, "pattern": _contains(name)})
+        return self._to_domain(rows[0]) if rows else None
+
+    async def search(self, query: str) -> List[Medication]:
+        """Ranked full-text and name substring search"""
+        query = query.strip()
+        rows = await self._fetch(SEARCH, {"query": query, "pattern": _contains(query), "limit": self.max_results})
+        return [self._to_domain(row) for row in rows]
+
+    async def fuzzy_search(self, query: str, limit: int = 10) -> List[Medication]:
+        """Names most similar to a (possibly misspelled) query"""
+        rows = await self._fetch(FUZZY_SEARCH, {"query": query.strip(), "limit": min(limit, self.max_results)})
+        return [self._to_domain(row) for row in rows]
+
+    async def _fetch(self, statement, params: dict) -> list:
+        self.database.initialize()
+        async with self.database.async_session_maker() as session:
+            result = await session.execute(statement, params)
+            return result.mappings().all()
+
+    @staticmethod
+    def _to_domain(row) -> Medication:
+        try:
+            dosage_form = MedicationForm((row["dosage_form"] or "").lower())
+        except ValueError:
+            dosage_form = MedicationForm.UNKNOWN
+        return Medication(
+            id=str(row["id"]),
+            generic_name=row["generic_name"],
+            brand_names=list(row["brand_names"] or []),
+            dosage_form=dosage_form,
+            strength_description=row["strength"] or "",
+            prescription_required=bool(row["prescription_required"]),
+            indications=list(row["indications"] or []),
+            warnings=list(row["warnings"] or [])
+        )
+
+
+def _contains(value: str) -> str:
+    """ILIKE pattern matching value anywhere, with its wildcards escaped"""
+    return "%" + value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
@@ -0,0 +1,304 @@
+# app/infrastructure/repositories/sqlite_medication_repository.py
+"""SQLite-backed repository for large embedded medication catalogs"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional
+
+from ...domain.models.medication import Medication, MedicationForm
+from ...domain.repositories.medication_repository import MedicationRepository
+from ..search.fuzzy_index import edit_distance
+from ..search.text import normalize_name
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS medications (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    generic_name TEXT NOT NULL,
+    brand_names TEXT NOT NULL,
+    dosage_form TEXT NOT NULL,
+    strength_description TEXT NOT NULL,
+    prescription_required INTEGER NOT NULL,
+    indications TEXT NOT NULL,
+    warnings TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_medications_generic_name ON medications(generic_name COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS medications_fts USING fts5(
+    generic_name, brand_names, indications, warnings,
+    tokenize = 'trigram'
+);
+"""
+
+_COLUMNS = "id, generic_name, brand_names, dosage_form, strength_description, prescription_required, indications, warnings"
+
+# The trigram tokenizer matches any substring of three or more characters
+_MIN_FTS_QUERY = 3
+
+# Names sharing a trigram with a misspelled query that are checked by edit distance
+_FUZZY_CANDIDATES = 200
+
+# search_ranking.relevance_key in SQL, so max_results keeps the best matches
+# rather than the first ones; parameters are (query, prefix%, %query%) twice
+_RELEVANCE = (
+    "CASE "
+    "WHEN lower(generic_name) = ? THEN 0 "
+    "WHEN generic_name LIKE ? ESCAPE '\\' THEN 1 "
+    "WHEN generic_name LIKE ? ESCAPE '\\' THEN 2 "
+    "WHEN EXISTS (SELECT 1 FROM json_each(brand_names) WHERE lower(json_each.value) = ?) THEN 3 "
+    "WHEN EXISTS (SELECT 1 FROM json_each(brand_names) WHERE json_each.value LIKE ? ESCAPE '\\') THEN 4 "
+    "WHEN EXISTS (SELECT 1 FROM json_each(brand_names) WHERE json_each.value LIKE ? ESCAPE '\\') THEN 5 "
+    "ELSE 6 END, length(generic_name), rowid"
+)
+
+
+class SQLiteMedicationRepository(MedicationRepository):
+    """Medication catalog in an embedded SQLite file with an FTS5 index.
+
+    Only the rows a query returns are turned into ``Medication`` objects, so
+    a worker does not hold the whole catalog in memory. Build the file with
+    scripts/build_sqlite_catalog.py (``create``); serving opens it read-only,
+    so it may live on a read-only volume. SQLite calls are blocking, so they
+    run in a small thread pool (one read connection per thread) to keep the
+    event loop free.
+    """
+
+    def __init__(self, db_path: str, max_results: int = 1000, max_workers: int = 4):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"SQLite catalog {db_path} not found - build it with scripts/build_sqlite_catalog.py")
+        self.db_path = db_path
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cogitto-sqlite")
+        self._local = threading.local()
+        # Every pool thread's connection, so close() can close them all
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Version checks and counts run on the caller's thread (the event loop for cached searches)
+        self._sync_connection = self._connect_read_only()
+        self._sync_lock = threading.Lock()
+
+    @classmethod
+    def create(cls, db_path: str, medications: Iterable[Medication], **kwargs) -> "SQLiteMedicationRepository":
+        """Create (or refresh) a catalog file from domain medications"""
+        cls.create_schema(db_path)
+        repository = cls(db_path, **kwargs)
+        repository.load(medications)
+        return repository
+
+    @staticmethod
+    def create_schema(db_path: str):
+        """Create the catalog tables and indexes in db_path if they are missing"""
+        with closing(sqlite3.connect(db_path)) as connection, connection:
+            connection.executescript(SCHEMA)
+
+    def load(self, medications: Iterable[Medication]):
+        """Replace the stored catalog with medications, in one transaction.
+
+        As in the in-memory catalog, the first medication with a given id wins.
+        """
+        with closing(sqlite3.connect(self.db_path)) as connection, connection:
+            connection.execute("DELETE FROM medications")
+            connection.execute("DELETE FROM medications_fts")
+            seen = set()
+            digest = hashlib.sha256()
+            for med in medications:
+                if med.id in seen:
+                    continue
+                seen.add(med.id)
+                rowid = len(seen)
+                row = (
+                    med.id, med.generic_name, json.dumps(med.brand_names),
+                    med.dosage_form.value, med.strength_description, int(med.prescription_required),
+                    json.dumps(med.indications), json.dumps(med.warnings),
+                )
+                digest.update(json.dumps(row).encode())
+                connection.execute(
+                    f"INSERT INTO medications (rowid, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rowid, *row),
+                )
+                connection.execute(
+                    "INSERT INTO medications_fts (rowid, generic_name, brand_names, indications, warnings) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        rowid, med.generic_name, "\n".join(med.brand_names),
+                        "\n".join(med.indications), "\n".join(med.warnings),
+                    ),
+                )
+            connection.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('version', ?)",
+                (digest.hexdigest()[:16],),
+            )
+
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """Content hash written by the last load; None for files loaded before versions were stored"""
+        try:
+            with self._sync_lock:
+                row = self._sync_connection.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        with self._sync_lock:
+            return self._sync_connection.execute("SELECT count(*) FROM medications").fetchone()[0]
+
+    def close(self):
+        """Stop the worker threads and close every connection"""
+        self._executor.shutdown(wait=True)
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._sync_connection.close()
+
+    async def find_by_id(self, medication_id: str) -> Optional[Medication]:
+        """Find medication by ID"""
+        rows = await self._run(f"SELECT {_COLUMNS} FROM medications WHERE id = ?", (medication_id,))
+        return self._to_domain(rows[0]) if rows else None
+
+    async def find_by_ids(self, medication_ids: List[str]) -> Dict[str, Medication]:
+        """Find several medications by ID in one query"""
+        unique_ids = list(dict.fromkeys(medication_ids))[:self.max_results]
+        if not unique_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in unique_ids)
+        rows = await self._run(f"SELECT {_COLUMNS} FROM medications WHERE id IN ({placeholders})", tuple(unique_ids))
+        return {row[0]: self._to_domain(row) for row in rows}
+
+    async def find_by_generic_name(self, name: str) -> Optional[Medication]:
+        """Find medication by generic name (case-insensitive)"""
+        rows = await self._run(
+            f"SELECT {_COLUMNS} FROM medications WHERE generic_name = ? COLLATE NOCASE ORDER BY rowid LIMIT 1",
+            (name.strip(),),
+        )
+        return self._to_domain(rows[0]) if rows else None
+
+    async def search(self, query: str) -> List[Medication]:
+        """Search medications by name (generic or brand) through the FTS index"""
+        query = query.strip()
+        escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        relevance_params = (query.lower(), escaped + "%", "%" + escaped + "%") * 2
+        if len(query) < _MIN_FTS_QUERY:
+            # Too short for trigrams - fall back to LIKE on the generic name and
+            # each decoded brand name (not the JSON text, with its quotes and escapes)
+            pattern = "%" + escaped + "%"
+            where = (
+                "generic_name LIKE ? ESCAPE '\\' "
+                "OR EXISTS (SELECT 1 FROM json_each(brand_names) WHERE json_each.value LIKE ? ESCAPE '\\')"
+            )
+            where_params = (pattern, pattern)
+        else:
+            where = "rowid IN (SELECT rowid FROM medications_fts WHERE medications_fts MATCH ?)"
+            where_params = (f"{{generic_name brand_names}} : {self._phrase(query)}",)
+        # The max_results most relevant matches, returned in catalog order like the other repositories
+        sql = (
+            f"SELECT {_COLUMNS} FROM ("
+            f"SELECT rowid AS position, {_COLUMNS} FROM medications WHERE {where} ORDER BY {_RELEVANCE} LIMIT ?"
+            ") ORDER BY position"
+        )
+        rows = await self._run(sql, (*where_params, *relevance_params, self.max_results))
+        return [self._to_domain(row) for row in rows]
+
+    async def fuzzy_search(self, query: str, limit: int = 10) -> List[Medication]:
+        """Names within a couple of typos of query, closest first.
+
+        Candidates are the rows sharing at least one trigram with the query
+        (best bm25 first); they are ranked by edit distance to the whole
+        names and their words, with the same thresholds as FuzzyIndex.
+        """
+        term = normalize_name(query)
+        if len(term) < _MIN_FTS_QUERY:
+            return []
+        # Short words tolerate a single typo only
+        max_distance = 1 if len(term) <= 4 else 2
+
+        trigrams = dict.fromkeys(term[i:i + 3] for i in range(len(term) - 2))
+        match = "{generic_name brand_names} : (" + " OR ".join(self._phrase(t) for t in trigrams) + ")"
+        sql = (
+            f"SELECT m.rowid, {', '.join('m.' + column for column in _COLUMNS.split(', '))} "
+            "FROM medications_fts JOIN medications m ON m.rowid = medications_fts.rowid "
+            "WHERE medications_fts MATCH ? ORDER BY bm25(medications_fts) LIMIT ?"
+        )
+        rows = await self._run(sql, (match, _FUZZY_CANDIDATES))
+
+        scored = []
+        for row in rows:
+            distance = max_distance + 1
+            for name in [row[2], *json.loads(row[3])]:
+                for candidate in self._fuzzy_terms(name):
+                    distance = min(distance, edit_distance(term, candidate, max_distance))
+            if distance <= max_distance:
+                scored.append((distance, row[0], row[1:]))
+        scored.sort(key=lambda item: item[:2])
+        return [self._to_domain(row) for _, _, row in scored[:limit]]
+
+    async def search_text(self, query: str, limit: int = 50) -> List[Medication]:
+        """Full-text search over names, indications and warnings, best matches first"""
+        query = query.strip()
+        if len(query) < _MIN_FTS_QUERY:
+            return []
+        sql = (
+            f"SELECT {', '.join('m.' + column for column in _COLUMNS.split(', '))} "
+            "FROM medications_fts JOIN medications m ON m.rowid = medications_fts.rowid "
+            "WHERE medications_fts MATCH ? ORDER BY bm25(medications_fts) LIMIT ?"
+        )
+        rows = await self._run(sql, (self._phrase(query), min(limit, self.max_results)))
+        return [self._to_domain(row) for row in rows]
+
+    async def get_all(self) -> List[Medication]:
+        """Get all medications (bounded by max_results)"""
+        rows = await self._run(f"SELECT {_COLUMNS} FROM medications ORDER BY rowid LIMIT ?", (self.max_results,))
+        return [self._to_domain(row) for row in rows]
+
+    async def _run(self, sql: str, params: tuple) -> list:
+        """Execute a read query on the thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_all, sql, params)
+
+    def _fetch_all(self, sql: str, params: tuple) -> list:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect_read_only()
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection.execute(sql, params).fetchall()
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        # check_same_thread=False so close() can close it from another thread
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+
+    @staticmethod
+    def _fuzzy_terms(name: str) -> List[str]:
+        """The whole normalized name plus each of its words (as FuzzyIndex indexes them)"""
+        text = normalize_name(name)
+        return [text, *(word for word in text.split(" ") if len(word) >= _MIN_FTS_QUERY and word != text)]
+
+    @staticmethod
+    def _phrase(query: str) -> str:
+        """Quote user input as one FTS5 phrase so operators are not interpreted"""
+        return '"' + query.replace('"', '""') + '"'
+
+    @staticmethod
+    def _to_domain(row: tuple) -> Medication:
+        return Medication(
+            id=row[0],
+            generic_name=row[1],
+            brand_names=json.loads(row[2]),
+            dosage_form=MedicationForm(row[3]),
+            strength_description=row[4],
+            prescription_required=bool(row[5]),
+            indications=json.loads(row[6]),
+            warnings=json.loads(row[7])
+        )
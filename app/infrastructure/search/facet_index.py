@@ -0,0 +1,101 @@
+# app/infrastructure/search/facet_index.py
+"""Bitset-backed faceted filtering for Cogitto's medication catalog"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence
+
+
+def facet_value(value: Any) -> Hashable:
+    """Normalize a field value for facet matching (enums by value, strings case-insensitively)"""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
+class FacetIndex:
+    """One bitset (a Python int) per facet value, bit i set for catalog position i.
+
+    Values selected within one facet are OR-ed, facets are AND-ed, and facet
+    counts are popcounts of ``bitset & selection`` - a handful of big-int
+    operations instead of a pass over every medication.
+    """
+
+    def __init__(self, items: Sequence[Any], facets: Mapping[str, Callable[[Any], Any]]):
+        self.size = len(items)
+        self.all_bits = (1 << self.size) - 1
+        self._bitsets: Dict[str, Dict[Hashable, int]] = {name: {} for name in facets}
+        self._labels: Dict[str, Dict[Hashable, Any]] = {name: {} for name in facets}
+
+        for name, accessor in facets.items():
+            labels = self._labels[name]
+            positions: Dict[Hashable, List[int]] = {}
+            for position, item in enumerate(items):
+                raw = accessor(item)
+                key = facet_value(raw)
+                if key in positions:
+                    positions[key].append(position)
+                else:
+                    positions[key] = [position]
+                    labels[key] = raw.value if isinstance(raw, Enum) else raw
+            # Set each value's bits in a byte buffer and convert once; OR-ing
+            # 1 << position into a growing int would copy it for every item
+            for key, value_positions in positions.items():
+                buffer = bytearray((self.size + 7) // 8)
+                for position in value_positions:
+                    buffer[position >> 3] |= 1 << (position & 7)
+                self._bitsets[name][key] = int.from_bytes(buffer, "little")
+
+    @property
+    def facet_names(self) -> List[str]:
+        return list(self._bitsets)
+
+    def select(self, selections: Mapping[str, Optional[Iterable[Any]]]) -> int:
+        """Bitset of items matching every facet (any of the given values per facet)"""
+        bits = self.all_bits
+        for name, values in selections.items():
+            if values is None:
+                continue
+            if name not in self._bitsets:
+                raise ValueError(f"Unknown facet: {name}")
+            bitsets = self._bitsets[name]
+            facet_bits = 0
+            for value in values:
+                facet_bits |= bitsets.get(facet_value(value), 0)
+            bits &= facet_bits
+            if not bits:
+                break
+        return bits
+
+    def counts(self, bits: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Per-facet value counts within a selection (all items by default)"""
+        if bits is None:
+            bits = self.all_bits
+        counts = {}
+        for name, bitsets in self._bitsets.items():
+            facet_counts = {}
+            for key, facet_bits in bitsets.items():
+                count = (facet_bits & bits).bit_count()
+                if count:
+                    facet_counts[str(self._labels[name][key])] = count
+            counts[name] = facet_counts
+        return counts
+
+    @staticmethod
+    def positions(bits: int, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """Positions of set bits in ascending order, optionally one page of them"""
+        # bin() renders the bitset once; find() then skips runs of zeros quickly
+        digits = bin(bits)[:1:-1]
+        positions = []
+        index = digits.find("1")
+        skipped = 0
+        while index != -1:
+            if skipped < offset:
+                skipped += 1
+            else:
+                positions.append(index)
+                if limit is not None and len(positions) == limit:
+                    break
+            index = digits.find("1", index + 1)
+        return positions
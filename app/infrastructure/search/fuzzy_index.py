@@ -0,0 +1,144 @@
+# app/infrastructure/search/fuzzy_index.py
+"""Typo-tolerant name lookup for Cogitto (SymSpell-style deletion dictionary)"""
+
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from .text import normalize_name
+
+
+class FuzzyMatch(NamedTuple):
+    """A catalog position whose name is within ``distance`` edits of the query"""
+    position: int
+    term: str
+    distance: int
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[len(b)], max_distance + 1)
+
+
+class FuzzyIndex:
+    """Deletion dictionary over whole names and the words inside them.
+
+    Every indexed term contributes all strings reachable by deleting up to
+    ``max_distance`` characters from its first ``prefix_length`` characters.
+    A query generates the same deletions, so candidate terms come from a few
+    dict lookups instead of a scan, and only those are checked with a bounded
+    edit distance. Deletions are generated once per distinct prefix, which
+    many terms share, so build cost and memory stay linear in the number of
+    terms.
+    """
+
+    def __init__(self, names_per_item: Iterable[Iterable[str]], max_distance: int = 2,
+                 prefix_length: int = 7, min_term_length: int = 3):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_term_length = min_term_length
+        self._terms: Dict[str, Set[int]] = {}
+        self._terms_by_prefix: Dict[str, List[str]] = {}
+        self._deletes: Dict[str, List[str]] = {}
+
+        # Products share names, so each distinct name is split into terms once
+        positions_by_name: Dict[str, List[int]] = {}
+        for position, names in enumerate(names_per_item):
+            for name in names:
+                if name in positions_by_name:
+                    positions_by_name[name].append(position)
+                else:
+                    positions_by_name[name] = [position]
+
+        terms = self._terms
+        for name, positions in positions_by_name.items():
+            for term in self._terms_of(name):
+                if term in terms:
+                    terms[term].update(positions)
+                else:
+                    terms[term] = set(positions)
+
+        for term in terms:
+            prefix = term[:prefix_length]
+            if prefix in self._terms_by_prefix:
+                self._terms_by_prefix[prefix].append(term)
+            else:
+                self._terms_by_prefix[prefix] = [term]
+
+        deletes = self._deletes
+        for prefix in self._terms_by_prefix:
+            for deleted in self._deletions(prefix):
+                if deleted in deletes:
+                    deletes[deleted].append(prefix)
+                else:
+                    deletes[deleted] = [prefix]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def lookup(self, query: str, limit: int = 10) -> List[FuzzyMatch]:
+        """Return catalog positions ranked by edit distance, closest first"""
+        term = normalize_name(query)
+        if len(term) < self.min_term_length:
+            return []
+        # Short words tolerate a single typo only
+        max_distance = 1 if len(term) <= 4 else self.max_distance
+
+        prefixes: Set[str] = set()
+        for deleted in self._deletions(term[:self.prefix_length], max_distance):
+            prefixes.update(self._deletes.get(deleted, ()))
+        candidates = [candidate for prefix in prefixes for candidate in self._terms_by_prefix[prefix]]
+
+        scored: List[Tuple[int, int, str]] = []
+        for candidate in candidates:
+            distance = edit_distance(term, candidate, max_distance)
+            if distance <= max_distance:
+                for position in self._terms[candidate]:
+                    scored.append((distance, position, candidate))
+        scored.sort()
+
+        matches = []
+        seen = set()
+        for distance, position, candidate in scored:
+            if position in seen:
+                continue
+            seen.add(position)
+            matches.append(FuzzyMatch(position, candidate, distance))
+            if len(matches) == limit:
+                break
+        return matches
+
+    def _terms_of(self, name: str) -> Set[str]:
+        """The whole normalized name plus each of its words"""
+        text = normalize_name(name)
+        terms = {word for word in text.split(" ") if len(word) >= self.min_term_length}
+        if len(text) >= self.min_term_length:
+            terms.add(text)
+        return terms
+
+    def _deletions(self, text: str, max_distance: int = None) -> Set[str]:
+        """All strings obtained by deleting up to max_distance characters"""
+        if max_distance is None:
+            max_distance = self.max_distance
+        deletions = {text}
+        frontier = {text}
+        for _ in range(min(max_distance, len(text))):
+            frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+            deletions |= frontier
+        return deletions
@@ -0,0 +1,107 @@
+# app/infrastructure/search/ngram_index.py
+"""Character n-gram inverted index for Cogitto's substring search"""
+
+from typing import Dict, Iterable, List, Set
+
+
+class NGramIndex:
+    """Inverted index from character n-grams to catalog positions.
+
+    Every distinct name (generic and brand) is broken into n-grams of length
+    ``min_gram`` to ``n`` once, however many products share it, and keeps the
+    list of positions that carry it. A substring query looks up the postings
+    of its own n-grams, intersects them starting from the rarest one, checks
+    the surviving names with a plain ``in`` and expands them to positions.
+    Results are catalog positions in load order, so callers keep the ordering
+    of the original linear scan.
+    """
+
+    def __init__(self, n: int = 3, min_gram: int = 2):
+        if min_gram < 1 or n < min_gram:
+            raise ValueError("n-gram sizes must satisfy 1 <= min_gram <= n")
+        self.n = n
+        self.min_gram = min_gram
+        self._size = 0
+        # n-gram -> ids of the distinct names containing it
+        self._postings: Dict[str, Set[int]] = {}
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._name_positions: List[List[int]] = []
+
+    @classmethod
+    def from_names(cls, names_per_item: Iterable[Iterable[str]], n: int = 3) -> "NGramIndex":
+        """Build an index where position i holds the names of the i-th item"""
+        index = cls(n=n)
+        for names in names_per_item:
+            index.add(names)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, names: Iterable[str]) -> int:
+        """Index the names of one catalog item and return its position"""
+        position = self._size
+        self._size += 1
+        for name in {name.lower() for name in names if name}:
+            name_id = self._name_ids.get(name)
+            if name_id is None:
+                name_id = self._add_name(name)
+            self._name_positions[name_id].append(position)
+        return position
+
+    def _add_name(self, name: str) -> int:
+        name_id = self._name_ids[name] = len(self._names)
+        self._names.append(name)
+        self._name_positions.append([])
+        postings = self._postings
+        for gram in self._grams(name):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = {name_id}
+            else:
+                posting.add(name_id)
+        return name_id
+
+    def search(self, query: str) -> List[int]:
+        """Return positions of items with a name containing ``query``"""
+        query_lower = query.lower()
+        if not query_lower:
+            return list(range(self._size))
+
+        if len(query_lower) < self.min_gram:
+            # Too short to have postings of its own - fall back to a scan of the names
+            candidates: Iterable[int] = range(len(self._names))
+        else:
+            postings = []
+            for gram in self._query_grams(query_lower):
+                posting = self._postings.get(gram)
+                if not posting:
+                    return []
+                postings.append(posting)
+
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+
+        matches = [name_id for name_id in candidates if query_lower in self._names[name_id]]
+        if len(matches) == 1:
+            return list(self._name_positions[matches[0]])
+        # A product can match through several of its names
+        return sorted({position for name_id in matches for position in self._name_positions[name_id]})
+
+    def _grams(self, text: str) -> Set[str]:
+        """All n-grams of length min_gram..n contained in text"""
+        grams = set()
+        for size in range(self.min_gram, self.n + 1):
+            for start in range(len(text) - size + 1):
+                grams.add(text[start:start + size])
+        return grams
+
+    def _query_grams(self, query: str) -> Set[str]:
+        """The longest n-grams covering the query (fewest, most selective postings)"""
+        size = min(self.n, len(query))
+        return {query[start:start + size] for start in range(len(query) - size + 1)}
@@ -0,0 +1,98 @@
+# app/infrastructure/search/prefix_index.py
+"""Sorted-array prefix index for Cogitto's autocomplete"""
+
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Tuple
+
+from .text import normalize_name
+
+# Match types, in ranking order
+GENERIC_PREFIX = "generic"
+BRAND_PREFIX = "brand"
+WORD_PREFIX = "word"
+
+_MATCH_RANK = {GENERIC_PREFIX: 0, BRAND_PREFIX: 1, WORD_PREFIX: 2}
+
+
+class Completion(NamedTuple):
+    """One autocomplete suggestion pointing back at a catalog position"""
+    position: int
+    text: str
+    match_type: str
+    exact: bool
+
+
+class PrefixIndex:
+    """Prefix lookups over normalized generic and brand names.
+
+    Keys are kept in one sorted list and found with ``bisect``, so a lookup
+    costs O(log n) plus a scan of at least ``limit * scan_factor`` neighbours,
+    extended until ``limit`` distinct items are found (many aliases of one
+    drug share a prefix) but never past ``max_scan`` entries.
+    Besides whole names, every later word of a name is indexed as well
+    ("metf" completes "sitagliptin and metformin hydrochloride"), ranked after
+    whole-name matches.
+    """
+
+    def __init__(self, names_per_item: Iterable[Tuple[str, Iterable[str]]], scan_factor: int = 4,
+                 max_scan: int = 2000):
+        self.scan_factor = scan_factor
+        self.max_scan = max_scan
+        entries = []
+        for position, (generic_name, brand_names) in enumerate(names_per_item):
+            entries.extend(self._entries(position, generic_name, GENERIC_PREFIX))
+            for brand in brand_names:
+                entries.extend(self._entries(position, brand, BRAND_PREFIX))
+        entries.sort()
+        self._keys = [entry[0] for entry in entries]
+        self._entries_sorted = entries
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Completion]:
+        """Return up to ``limit`` completions, one per catalog item"""
+        key = normalize_name(prefix)
+        if not key or limit <= 0:
+            return []
+
+        start = bisect_left(self._keys, key)
+        window = []
+        positions = set()
+        minimum = limit * self.scan_factor
+        for index in range(start, min(start + max(minimum, self.max_scan), len(self._keys))):
+            if not self._keys[index].startswith(key):
+                break
+            if len(window) >= minimum and len(positions) >= limit:
+                break
+            entry = self._entries_sorted[index]
+            window.append(entry)
+            positions.add(entry[2])
+
+        # Exact names first, then generic before brand before inner words,
+        # then shorter (closer) completions
+        window.sort(key=lambda entry: (entry[3] != key, _MATCH_RANK[entry[1]], len(entry[3]), entry[3]))
+
+        completions = []
+        seen = set()
+        for _, match_type, position, text in window:
+            if position in seen:
+                continue
+            seen.add(position)
+            completions.append(Completion(position, text, match_type, text == key))
+            if len(completions) == limit:
+                break
+        return completions
+
+    @staticmethod
+    def _entries(position: int, name: str, match_type: str):
+        """Sort entries for a whole name and for each of its later words"""
+        text = normalize_name(name)
+        if not text:
+            return []
+        entries = [(text, match_type, position, text)]
+        offset = text.find(" ")
+        while offset != -1:
+            entries.append((text[offset + 1:], WORD_PREFIX, position, text))
+            offset = text.find(" ", offset + 1)
+        return entries
@@ -0,0 +1,6 @@
+# app/infrastructure/search/text.py
+"""Text normalization shared by Cogitto's search indexes"""
+
+def normalize_name(name: str) -> str:
+    """Lowercase a medication name and collapse runs of whitespace"""
+    return " ".join(name.lower().split())
@@ -3,15 +3,19 @@ from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List
 from contextlib import asynccontextmanager
-from .api.v1.medications import router as medications_router
+from .api.v1.medications import router as medications_router, build_cogitto_service
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
+    # Startup - build the repository, its indexes and the service once per process
+    app.state.cogitto_service = build_cogitto_service()
     print("🚀 Cogitto: Medication AI Assistant started!")
     print("🧠 Intelligent medication management through AI")
     yield
     # Shutdown
+    repository = app.state.cogitto_service.repository
+    if hasattr(repository, "close"):
+        repository.close()
     print("👋 Cogitto shutting down")
 
 app = FastAPI(
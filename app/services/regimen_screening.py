@@ -0,0 +1,209 @@
+# app/services/regimen_screening.py
+"""Nightly interaction screening of every user's active medication regimen"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.catalog.interaction_index import InteractionIndex, brand_aliases, resolve_regimen
+from app.infrastructure.catalog.interaction_matrix import InteractionMatrix
+
+# One page of users: (user_id, active medication names)
+RegimenChunk = List[Tuple[Any, List[str]]]
+
+# Keyset pagination over user_id: each page is one short query that the
+# (user_id, is_active) index answers in order, on a connection of its own
+_FIRST_PAGE = text("""
+    SELECT user_id, array_agg(medication_name ORDER BY medication_name) AS medications
+    FROM user_medications
+    WHERE is_active = TRUE
+    GROUP BY user_id
+    ORDER BY user_id
+    LIMIT :limit
+""")
+_NEXT_PAGE = text("""
+    SELECT user_id, array_agg(medication_name ORDER BY medication_name) AS medications
+    FROM user_medications
+    WHERE is_active = TRUE AND user_id > :after
+    GROUP BY user_id
+    ORDER BY user_id
+    LIMIT :limit
+""")
+_INSERT_FINDINGS = text("""
+    INSERT INTO regimen_screening_results
+    (run_id, user_id, medication_count, interacting_pairs, highest_severity, findings)
+    VALUES (:run_id, :user_id, :medication_count, :interacting_pairs, :highest_severity, CAST(:findings AS JSONB))
+""")
+
+
+@dataclass
+class UserFindings:
+    """Interactions found in one user's active regimen"""
+    user_id: Any
+    medication_count: int
+    interacting_pairs: int
+    highest_severity: Optional[str]
+    findings: List[Dict[str, Any]]
+
+
+@dataclass
+class ScreeningRunSummary:
+    run_id: uuid.UUID
+    users_screened: int = 0
+    users_flagged: int = 0
+    chunks: int = 0
+    duration_seconds: float = 0.0
+    severity_counts: Dict[str, int] = field(default_factory=dict)
+
+
+def medication_aliases(medications: Iterable[Mapping[str, Any]],
+                       interactions: Mapping[Tuple[str, str], Dict[str, Any]]) -> Dict[str, str]:
+    """Brand aliases for catalog entries (dicts), resolved exactly as the API's catalog resolves them"""
+    names = ([med["generic_name"], *(med.get("brand_names") or ())] for med in medications)
+    return brand_aliases(names, InteractionIndex(interactions).adjacency)
+
+
+def screen_chunk(index: InteractionIndex, matrix: InteractionMatrix, aliases: Mapping[str, str],
+                 chunk: RegimenChunk) -> List[UserFindings]:
+    """Findings for the users in chunk that have at least one interacting pair.
+
+    The whole chunk is screened at once on the interaction matrix; only the
+    flagged regimens are then walked on the index for the interaction details.
+    """
+    regimens = [resolve_regimen(medications, aliases) for _, medications in chunk]
+
+    results = []
+    for (user_id, _), regimen, summary in zip(chunk, regimens, matrix.screen_many(regimens)):
+        if not summary.interacting_pairs:
+            continue
+        pairs = index.check_regimen(regimen)
+        results.append(UserFindings(
+            user_id=user_id,
+            medication_count=len(set(regimen)),
+            interacting_pairs=len(pairs),
+            highest_severity=pairs[0][2].get("severity"),
+            findings=[
+                {
+                    "medications": [med1, med2],
+                    "severity": details.get("severity"),
+                    "description": details.get("description"),
+                    "recommendation": details.get("recommendation"),
+                }
+                for med1, med2, details in pairs
+            ]
+        ))
+    return results
+
+
+# Per-process screening state, built once by _init_worker
+_WORKER_STATE: Optional[Tuple[InteractionIndex, InteractionMatrix, Mapping[str, str]]] = None
+
+
+def _init_worker(interactions: Mapping[Tuple[str, str], Dict[str, Any]], aliases: Mapping[str, str]):
+    global _WORKER_STATE
+    index = InteractionIndex(interactions)
+    _WORKER_STATE = (index, InteractionMatrix(index), aliases)
+
+
+def _screen_in_worker(chunk: RegimenChunk) -> Tuple[int, List[UserFindings]]:
+    return len(chunk), screen_chunk(*_WORKER_STATE, chunk)
+
+
+async def stream_active_regimens(engine: AsyncEngine, chunk_size: int) -> AsyncIterator[RegimenChunk]:
+    """Every user's active medications, chunk_size users at a time, in user_id order.
+
+    Each page is read on its own pooled connection, which goes back to the
+    pool before the page is yielded, so a run never holds one open while
+    the workers screen.
+    """
+    after = None
+    while True:
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            if after is None:
+                result = await connection.execute(_FIRST_PAGE, {"limit": chunk_size})
+            else:
+                result = await connection.execute(_NEXT_PAGE, {"after": after, "limit": chunk_size})
+            chunk = [(row.user_id, list(row.medications)) for row in result]
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        after = chunk[-1][0]
+
+
+async def write_findings(engine: AsyncEngine, run_id: uuid.UUID, findings: List[UserFindings]):
+    """Store one chunk's findings in a single transaction"""
+    if not findings:
+        return
+    async with engine.begin() as connection:
+        await connection.execute(_INSERT_FINDINGS, [
+            {
+                "run_id": run_id,
+                "user_id": result.user_id,
+                "medication_count": result.medication_count,
+                "interacting_pairs": result.interacting_pairs,
+                "highest_severity": result.highest_severity,
+                "findings": json.dumps(result.findings),
+            }
+            for result in findings
+        ])
+
+
+class RegimenScreeningJob:
+    """Screen every active regimen against the interaction data in a process pool.
+
+    Chunks of users are read one page at a time and handed to the pool; at
+    most two chunks per worker are in flight, so memory stays flat however
+    many users there are. Each worker builds the interaction index and
+    matrix once, when it starts. Findings are written chunk by chunk, in
+    user order, for users with at least one interacting pair.
+    """
+
+    def __init__(self, interactions: Mapping[Tuple[str, str], Dict[str, Any]],
+                 aliases: Optional[Mapping[str, str]] = None, processes: Optional[int] = None):
+        self.interactions = dict(interactions)
+        self.aliases = dict(aliases or {})
+        self.processes = processes or multiprocessing.cpu_count()
+
+    async def run(self, chunks: AsyncIterator[RegimenChunk],
+                  write: Callable[[uuid.UUID, List[UserFindings]], Awaitable[None]]) -> ScreeningRunSummary:
+        summary = ScreeningRunSummary(run_id=uuid.uuid4())
+        started = time.perf_counter()
+
+        async def collect(pending):
+            screened, findings = await asyncio.to_thread(pending.popleft().get)
+            await write(summary.run_id, findings)
+            summary.users_screened += screened
+            summary.users_flagged += len(findings)
+            for result in findings:
+                severity = result.highest_severity or "unknown"
+                summary.severity_counts[severity] = summary.severity_counts.get(severity, 0) + 1
+
+        with multiprocessing.Pool(self.processes, _init_worker, (self.interactions, self.aliases)) as pool:
+            pending = deque()
+            async for chunk in chunks:
+                pending.append(pool.apply_async(_screen_in_worker, (chunk,)))
+                summary.chunks += 1
+                if len(pending) >= 2 * self.processes:
+                    await collect(pending)
+            while pending:
+                await collect(pending)
+
+        summary.duration_seconds = round(time.perf_counter() - started, 3)
+        return summary
+
+    async def run_against_database(self, engine: AsyncEngine, chunk_size: int = 1000) -> ScreeningRunSummary:
+        return await self.run(
+            stream_active_regimens(engine, chunk_size),
+            lambda run_id, findings: write_findings(engine, run_id, findings)
+        )
@@ -0,0 +1,119 @@
+# benchmarks/synthetic_catalog.py
+"""Realistic synthetic medication catalogs for scale testing"""
+
+import random
+from typing import Any, Dict, List, Tuple
+
+# Name parts that combine into plausible, unique generic names
+_PREFIXES = [
+    "ab", "ace", "al", "am", "ator", "az", "ben", "bis", "bu", "can", "car", "cef", "cip", "cla", "clo",
+    "dal", "dex", "di", "do", "dul", "en", "er", "es", "fa", "fe", "flu", "ga", "gli", "hy", "ibu",
+    "in", "ir", "ke", "la", "le", "li", "lo", "me", "mi", "mo", "na", "ne", "ni", "ol", "om",
+    "pa", "pe", "pi", "pra", "que", "ra", "ri", "ro", "sa", "se", "si", "su", "ta", "te", "ti",
+    "to", "tra", "va", "ve", "war", "za", "zi", "zo",
+]
+_STEMS = [
+    "ba", "bi", "ce", "cla", "da", "de", "do", "fa", "fi", "ga", "ge", "la", "le", "li", "lo",
+    "ma", "me", "mo", "na", "ne", "no", "pa", "pe", "ra", "re", "ri", "ro", "sa", "se", "ta",
+    "te", "ti", "to", "va", "xa", "za",
+]
+_SUFFIXES = [
+    "pril", "sartan", "olol", "statin", "mab", "azole", "cillin", "dipine", "formin", "oxetine",
+    "tidine", "profen", "semide", "prazole", "triptan", "zepam", "cycline", "floxacin", "gliptin", "vir",
+]
+_BRAND_PARTS = [
+    "Acu", "Bri", "Cal", "Dura", "Evo", "Flex", "Gen", "Hali", "Ivo", "Jen", "Kor", "Lum", "Max",
+    "Nova", "Opti", "Pro", "Qua", "Rel", "Sol", "Tri", "Ulti", "Vel", "Xa", "Zen",
+]
+_BRAND_ENDINGS = ["ex", "ia", "ix", "on", "or", "ra", "um", "yl", "ax", "in"]
+_BRAND_VARIANTS = ["", " XR", " ER", " Extra Strength", " Junior", " PM", " Plus"]
+
+_DOSAGE_FORMS = [("tablet", 45), ("capsule", 25), ("liquid", 10), ("injection", 8), ("topical", 7), ("inhaler", 5)]
+_INDICATIONS = [
+    "hypertension", "pain", "diabetes", "infection", "depression", "anxiety", "asthma", "arthritis",
+    "high cholesterol", "heart failure", "migraine", "allergies", "insomnia", "acid reflux", "epilepsy",
+]
+_WARNINGS = [
+    "May cause dizziness", "Do not use during pregnancy", "Avoid alcohol", "May cause drowsiness",
+    "Monitor kidney function", "Monitor liver function", "Risk of bleeding", "Do not stop abruptly",
+    "May increase blood sugar", "Take with food", "May cause sensitivity to sunlight",
+    "Not for use in children under 12", "Stop use and ask a doctor if symptoms persist",
+]
+_MANUFACTURER_WORDS = ["Pharma", "Laboratories", "Health", "Therapeutics", "Generics", "Biotech"]
+_DATA_SOURCES = [("FDA_NDC", 70), ("FDA_ORANGE_BOOK", 25), ("RXNORM", 5)]
+_SEVERITIES = [("minor", 50), ("moderate", 35), ("major", 15)]
+
+
+def generic_name(index: int) -> str:
+    """The index-th synthetic generic name (distinct for every index)"""
+    index, suffix = divmod(index, len(_SUFFIXES))
+    index, prefix = divmod(index, len(_PREFIXES))
+    stems = []
+    while True:
+        index, stem = divmod(index, len(_STEMS))
+        stems.append(_STEMS[stem])
+        if not index:
+            break
+        index -= 1
+    return _PREFIXES[prefix] + "".join(stems) + _SUFFIXES[suffix]
+
+
+def generate_catalog(size: int, seed: int = 0, products_per_generic: float = 5.0,
+                     interactions_per_generic: float = 8.0) -> Tuple[List[Dict[str, Any]], Dict[Tuple[str, str], Dict[str, str]]]:
+    """Synthetic FDA-style catalog: ``size`` products and a dense interaction graph.
+
+    Products are grouped under roughly size / products_per_generic generic
+    names, each with a few brand aliases (and strength/release variants of
+    them), so names, manufacturers and warning texts repeat the way they do
+    in the NDC product list. Each generic interacts with about
+    interactions_per_generic others. The same seed always gives the same data.
+    """
+    rng = random.Random(seed)
+    generic_count = max(1, round(size / products_per_generic))
+    generics = [generic_name(i) for i in range(generic_count)]
+    manufacturers = [
+        f"{rng.choice(_BRAND_PARTS)}{rng.choice(_BRAND_ENDINGS)} {rng.choice(_MANUFACTURER_WORDS)}"
+        for _ in range(max(10, generic_count // 20))
+    ]
+    forms, form_weights = zip(*_DOSAGE_FORMS)
+    sources, source_weights = zip(*_DATA_SOURCES)
+
+    brands: Dict[str, List[str]] = {}
+    medications = []
+    for index in range(size):
+        generic = generics[index % generic_count] if index < generic_count else rng.choice(generics)
+        if generic not in brands:
+            brands[generic] = [
+                f"{rng.choice(_BRAND_PARTS)}{rng.choice(_BRAND_ENDINGS)}{rng.choice(_BRAND_ENDINGS)}"
+                for _ in range(rng.randint(1, 3))
+            ]
+        form = rng.choices(forms, form_weights)[0]
+        medications.append({
+            "id": f"syn-{index:07d}",
+            # Combination products ("x and y") appear now and then
+            "generic_name": generic if rng.random() > 0.03 else f"{generic} and {rng.choice(generics)}",
+            "brand_names": [brand + rng.choice(_BRAND_VARIANTS) for brand in brands[generic]],
+            "dosage_form": form,
+            "strength": f"{rng.choice([1, 2.5, 5, 10, 20, 25, 40, 50, 100, 250, 500])} mg",
+            "prescription_required": rng.random() < 0.7,
+            "indications": rng.sample(_INDICATIONS, rng.randint(1, 3)),
+            "warnings": rng.sample(_WARNINGS, rng.randint(1, 4)),
+            "manufacturer": rng.choice(manufacturers),
+            "data_source": rng.choices(sources, source_weights)[0],
+            "rxcui": str(rng.randint(100000, 9999999)),
+        })
+
+    severities, severity_weights = zip(*_SEVERITIES)
+    interactions = {}
+    pair_count = min(round(generic_count * interactions_per_generic / 2), generic_count * (generic_count - 1) // 2)
+    while len(interactions) < pair_count:
+        first, second = rng.sample(generics, 2)
+        if (second, first) in interactions:
+            continue
+        severity = rng.choices(severities, severity_weights)[0]
+        interactions[(first, second)] = {
+            "severity": severity,
+            "description": f"Synthetic {severity} interaction between {first} and {second}",
+            "recommendation": "Monitor the patient" if severity != "major" else "Avoid combination",
+        }
+    return medications, interactions
@@ -0,0 +1,33 @@
+# scripts/build_catalog_snapshot.py
+"""Build data/catalog.snapshot from the generated FDA data module"""
+
+import argparse
+import runpy
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.infrastructure.catalog.snapshot import write_snapshot, read_snapshot
+
+def main():
+    parser = argparse.ArgumentParser(description="Build Cogitto's binary catalog snapshot")
+    parser.add_argument("--source", default="data/fda_data_integration.py", help="Generated FDA data module")
+    parser.add_argument("--output", default="data/catalog.snapshot", help="Snapshot file to write")
+    args = parser.parse_args()
+    
+    namespace = runpy.run_path(args.source)
+    write_snapshot(
+        args.output,
+        namespace["FDA_MEDICATIONS_DATA"],
+        namespace.get("FDA_INTERACTIONS", {}),
+        source=args.source
+    )
+    
+    snapshot = read_snapshot(args.output)
+    print(f"✅ Wrote {args.output}: {len(snapshot.medications)} medications, "
+          f"{len(snapshot.interactions)} interactions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# scripts/build_sqlite_catalog.py
+"""Build the SQLite/FTS5 catalog file the v1 API serves with COGITTO_CATALOG_SQLITE"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.domain.models.medication import Medication, MedicationForm
+from app.infrastructure.catalog.snapshot import load_catalog_data
+from app.infrastructure.repositories.sqlite_medication_repository import SQLiteMedicationRepository
+
+def to_domain(entry: dict) -> Medication:
+    """Domain medication for one FDA catalog entry"""
+    try:
+        dosage_form = MedicationForm((entry.get("dosage_form") or "").lower())
+    except ValueError:
+        dosage_form = MedicationForm.UNKNOWN
+    return Medication(
+        id=str(entry["id"]),
+        generic_name=entry["generic_name"],
+        brand_names=list(entry.get("brand_names") or []),
+        dosage_form=dosage_form,
+        strength_description=entry.get("strength") or "",
+        prescription_required=bool(entry.get("prescription_required")),
+        indications=list(entry.get("indications") or []),
+        warnings=list(entry.get("warnings") or [])
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Build Cogitto's SQLite catalog")
+    parser.add_argument("--snapshot", default=os.getenv("COGITTO_CATALOG_SNAPSHOT", "data/catalog.snapshot"),
+                        help="Catalog snapshot")
+    parser.add_argument("--source", default="data/fda_data_integration.py", help="Generated FDA data module")
+    parser.add_argument("--output", default=os.getenv("COGITTO_CATALOG_SQLITE", "data/catalog.db"),
+                        help="SQLite file to write")
+    args = parser.parse_args()
+    
+    snapshot = load_catalog_data(args.snapshot, args.source)
+    repository = SQLiteMedicationRepository.create(args.output, (to_domain(entry) for entry in snapshot.medications))
+    try:
+        print(f"✅ Wrote {args.output}: {len(repository)} medications")
+    finally:
+        repository.close()
+
+if __name__ == "__main__":
+    main()
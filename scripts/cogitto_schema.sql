@@ -5,6 +5,17 @@
 -- Create database (run this separately)
 -- CREATE DATABASE cogitto_production;
 
+-- Trigram matching for medication name search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Brand names as one searchable string. array_to_string is only STABLE, which
+-- index and generated-column expressions reject; this wrapper is IMMUTABLE.
+-- Queries must use the same expression for the planner to pick the index.
+CREATE OR REPLACE FUNCTION medication_brand_text(brand_names TEXT[])
+RETURNS TEXT AS $$
+    SELECT COALESCE(array_to_string(brand_names, ' '), '')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
 -- Users table - core user management
 CREATE TABLE users (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -72,7 +83,7 @@ CREATE TABLE medications (
     
     -- Indexing for search
     search_vector tsvector GENERATED ALWAYS AS (
-        to_tsvector('english', generic_name || ' ' || COALESCE(array_to_string(brand_names, ' '), ''))
+        to_tsvector('english', generic_name || ' ' || medication_brand_text(brand_names))
     ) STORED
 );
 
@@ -281,6 +292,9 @@ CREATE INDEX idx_users_email ON users(email);
 CREATE INDEX idx_users_active ON users(is_active) WHERE is_active = true;
 CREATE INDEX idx_medications_search ON medications USING GIN(search_vector);
 CREATE INDEX idx_medications_generic_name ON medications(generic_name);
+CREATE INDEX idx_medications_generic_name_lower ON medications(lower(generic_name));
+CREATE INDEX idx_medications_generic_name_trgm ON medications USING GIN(generic_name gin_trgm_ops);
+CREATE INDEX idx_medications_brand_names_trgm ON medications USING GIN(medication_brand_text(brand_names) gin_trgm_ops);
 CREATE INDEX idx_user_medications_user_active ON user_medications(user_id) WHERE is_currently_taking = true;
 CREATE INDEX idx_chat_sessions_user_active ON chat_sessions(user_id) WHERE is_active = true;
 CREATE INDEX idx_conversations_session ON conversations(session_id);
@@ -0,0 +1,30 @@
+# scripts/generate_synthetic_catalog.py
+"""Write a synthetic catalog snapshot for load and scale testing"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.infrastructure.catalog.snapshot import write_snapshot
+from benchmarks.synthetic_catalog import generate_catalog
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Cogitto catalog snapshot")
+    parser.add_argument("--size", type=int, default=100_000, help="Number of products (10k to 1M)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same catalog)")
+    parser.add_argument("--interactions-per-generic", type=float, default=8.0, help="Interaction graph density")
+    parser.add_argument("--output", default="data/synthetic.snapshot", help="Snapshot file to write")
+    args = parser.parse_args()
+    
+    medications, interactions = generate_catalog(
+        args.size, seed=args.seed, interactions_per_generic=args.interactions_per_generic
+    )
+    write_snapshot(args.output, medications, interactions, source=f"synthetic:size={args.size},seed={args.seed}")
+    print(f"✅ Wrote {args.output}: {len(medications)} medications, {len(interactions)} interactions")
+    print(f"   Serve it with COGITTO_CATALOG_SNAPSHOT={args.output}")
+
+if __name__ == "__main__":
+    main()
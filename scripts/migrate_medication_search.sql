@@ -0,0 +1,37 @@
+-- scripts/migrate_medication_search.sql
+-- Brings the medications table of a database created from an older
+-- cogitto_schema.sql up to the search schema PostgresMedicationRepository
+-- expects. Safe to run more than once:
+--   psql -d cogitto_production -f scripts/migrate_medication_search.sql
+--
+-- Re-adding search_vector rewrites the table and the indexes are built
+-- without CONCURRENTLY, so writes to medications block until it commits.
+
+BEGIN;
+
+-- Trigram matching for medication name search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Same definition as cogitto_schema.sql: the IMMUTABLE wrapper the brand
+-- index and the repository's queries share
+CREATE OR REPLACE FUNCTION medication_brand_text(brand_names TEXT[])
+RETURNS TEXT AS $$
+    SELECT COALESCE(array_to_string(brand_names, ' '), '')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- A generated column's expression cannot be altered in place before
+-- PostgreSQL 17, so the column (and idx_medications_search with it) is rebuilt
+ALTER TABLE medications DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE medications ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    to_tsvector('english', generic_name || ' ' || medication_brand_text(brand_names))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_medications_search ON medications USING GIN(search_vector);
+CREATE INDEX IF NOT EXISTS idx_medications_generic_name ON medications(generic_name);
+CREATE INDEX IF NOT EXISTS idx_medications_generic_name_lower ON medications(lower(generic_name));
+CREATE INDEX IF NOT EXISTS idx_medications_generic_name_trgm ON medications USING GIN(generic_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_medications_brand_names_trgm ON medications USING GIN(medication_brand_text(brand_names) gin_trgm_ops);
+
+COMMIT;
+
+ANALYZE medications;
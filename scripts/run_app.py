@@ -1,11 +1,34 @@
 # scripts/run_app.py
+import argparse
+import importlib.util
 import uvicorn
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).parent.parent
+
 # Add the app directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
+
+
+def load_catalog_app():
+    """The FDA catalog API from app.py, which the app/ package shadows for a plain import"""
+    spec = importlib.util.spec_from_file_location("cogitto_app", ROOT / "app.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["cogitto_app"] = module
+    spec.loader.exec_module(module)
+    return module.app
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Cogitto API")
+    parser.add_argument("--catalog-app", action="store_true",
+                        help="Serve the FDA catalog API in app.py (reads COGITTO_CATALOG_*) instead of app.main")
+    args = parser.parse_args()
+
     print("🚀 Starting Cogitto: Medication AI Assistant...")
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    if args.catalog_app:
+        # An app object rather than an import string, so no auto-reload
+        uvicorn.run(load_catalog_app(), host="0.0.0.0", port=8000)
+    else:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,57 @@
+# scripts/screen_user_regimens.py
+"""Nightly job: screen every user's active regimen for drug interactions.
+
+    python scripts/screen_user_regimens.py
+    python scripts/screen_user_regimens.py --processes 8 --chunk-size 2000
+
+Findings go to regimen_screening_results (see
+app/infrastructure/database/schemas/regimen_screening_schema.sql).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.infrastructure.catalog.base_interactions import BASE_INTERACTIONS
+from app.infrastructure.catalog.snapshot import load_catalog_data
+from app.infrastructure.database.connection import db_connection
+from app.services.regimen_screening import RegimenScreeningJob, medication_aliases
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Screen all active user regimens for interactions")
+    parser.add_argument("--snapshot", default=os.getenv("COGITTO_CATALOG_SNAPSHOT", "data/catalog.snapshot"),
+                        help="Catalog snapshot")
+    parser.add_argument("--source", default="data/fda_data_integration.py", help="Generated FDA data module")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Users per chunk")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    # Same interaction data the API serves
+    snapshot = load_catalog_data(args.snapshot, args.source)
+    interactions = dict(BASE_INTERACTIONS)
+    interactions.update(snapshot.interactions)
+    job = RegimenScreeningJob(interactions, medication_aliases(snapshot.medications, interactions), processes=args.processes)
+    print(f"🔍 Screening active regimens against {len(interactions)} interactions with {job.processes} workers")
+
+    db_connection.initialize()
+    try:
+        summary = await job.run_against_database(db_connection.engine, chunk_size=args.chunk_size)
+    finally:
+        await db_connection.close()
+
+    print(f"✅ Run {summary.run_id}: {summary.users_screened} users screened, "
+          f"{summary.users_flagged} flagged in {summary.duration_seconds}s")
+    for severity, count in sorted(summary.severity_counts.items()):
+        print(f"   {severity:16s} {count}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
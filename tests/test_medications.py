@@ -2,6 +2,7 @@
 import pytest
 from app.domain.models.medication import Medication, MedicationForm
 from app.infrastructure.repositories.in_memory_medication_repository import InMemoryMedicationRepository
+from app.infrastructure.repositories.sqlite_medication_repository import SQLiteMedicationRepository
 from app.domain.services.medication_service import CogittoMedicationService
 
 @pytest.mark.asyncio
@@ -25,3 +26,245 @@ async def test_cogitto_insights():
     insights = await service.get_medication_insights("3")  # lisinopril
     assert insights["safety_level"] in ["medium", "high"]
     assert "cogitto_recommendation" in insights
+
+@pytest.mark.asyncio
+async def test_cogitto_search_tolerates_typos():
+    """Misspelled queries fall back to fuzzy matching"""
+    repo = InMemoryMedicationRepository()
+    service = CogittoMedicationService(repo)
+    
+    results = await service.search_medications("ibuprofin")
+    assert [med.generic_name for med in results] == ["ibuprofen"]
+
+@pytest.mark.asyncio
+async def test_cogitto_search_is_ranked_and_paginated():
+    """Generic-name matches outrank brand matches and pages follow the cursor"""
+    repo = InMemoryMedicationRepository()
+    service = CogittoMedicationService(repo)
+    
+    # "pril" is inside lisinopril (generic) and Prilosec (brand of omeprazole)
+    page = await service.search_medications_page("pril", limit=1)
+    assert [med.generic_name for med in page.items] == ["lisinopril"]
+    assert page.total == 2 and page.next_cursor
+    
+    page = await service.search_medications_page("pril", limit=1, cursor=page.next_cursor)
+    assert [med.generic_name for med in page.items] == ["omeprazole"]
+    assert page.next_cursor is None
+    
+    with pytest.raises(ValueError):
+        await service.search_medications_page("pril", cursor="not-a-cursor")
+    
+    # Without a limit the service still returns every match, ranked
+    assert [med.generic_name for med in await service.search_medications("pril")] == ["lisinopril", "omeprazole"]
+
+@pytest.mark.asyncio
+async def test_repository_lookups_by_id_and_name():
+    """Id and name lookups resolve through the catalog maps"""
+    repo = InMemoryMedicationRepository()
+    
+    assert (await repo.find_by_id("4")).generic_name == "metformin"
+    assert (await repo.find_by_generic_name("Metformin")).id == "4"
+    assert await repo.find_by_generic_name("Glucophage") is None
+    assert repo.catalog.find_by_name("glucophage").id == "4"
+    assert await repo.find_by_id("404") is None
+
+def test_cogitto_service_is_app_scoped():
+    """The v1 API builds its service once in the lifespan and reuses it"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    
+    with TestClient(app) as client:
+        service = app.state.cogitto_service
+        assert client.get("/api/v1/medications/1").status_code == 200
+        assert client.get("/api/v1/medications/search?q=tylenol").status_code == 200
+        assert app.state.cogitto_service is service
+
+def test_catalog_reads_support_conditional_get():
+    """Catalog responses carry the catalog version as ETag and revalidate with 304"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    
+    with TestClient(app) as client:
+        response = client.get("/api/v1/medications/1")
+        etag = response.headers["ETag"]
+        assert etag == f'"{app.state.cogitto_service.repository.catalog_version}"'
+        
+        revalidated = client.get("/api/v1/medications/1", headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert revalidated.status_code == 304 and revalidated.content == b""
+        assert client.get("/api/v1/medications/1", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+@pytest.mark.asyncio
+async def test_sqlite_repository_matches_in_memory(tmp_path):
+    """The SQLite/FTS5 repository answers like the in-memory one"""
+    memory_repo = InMemoryMedicationRepository()
+    sqlite_repo = SQLiteMedicationRepository.create(str(tmp_path / "catalog.db"), memory_repo.medications)
+    
+    try:
+        for query in ["pril", "tylenol", "in", "zz"]:
+            expected = [med.id for med in await memory_repo.search(query)]
+            assert [med.id for med in await sqlite_repo.search(query)] == expected, query
+        
+        assert await sqlite_repo.find_by_id("3") == await memory_repo.find_by_id("3")
+        assert (await sqlite_repo.find_by_generic_name("Metformin")).id == "4"
+        assert [med.id for med in await sqlite_repo.search_text("bleeding")] == ["2"]
+        # Short queries match brand names, not the JSON they are stored as
+        assert await sqlite_repo.search('",') == []
+        for query in ["ibuprofin", "tylenl", "lipitr", "zzzzzz"]:
+            expected = [med.id for med in await memory_repo.fuzzy_search(query)]
+            assert [med.id for med in await sqlite_repo.fuzzy_search(query)] == expected, query
+        assert len(sqlite_repo) == len(memory_repo.medications)
+        
+        # A reload changes the version, so cached searches are invalidated
+        version = sqlite_repo.catalog_version
+        assert version
+        sqlite_repo.load(memory_repo.medications[:2])
+        assert sqlite_repo.catalog_version not in (None, version)
+    finally:
+        sqlite_repo.close()
+
+@pytest.mark.asyncio
+async def test_sqlite_repository_keeps_the_best_matches_and_serves_read_only(tmp_path):
+    """max_results keeps the most relevant rows, the file may be read-only, and close() closes every connection"""
+    import os
+    import stat
+    def medication(id, generic_name, brand_names=()):
+        return Medication(id=id, generic_name=generic_name, brand_names=list(brand_names),
+                          dosage_form=MedicationForm.TABLET, strength_description="10 mg",
+                          prescription_required=False, indications=[], warnings=[])
+    
+    medications = [medication(f"combo-{i}", f"aspirin and caffeine {i}", ["Ax"]) for i in range(5)]
+    medications += [medication("aspirin", "aspirin"), medication("ax", "zolpidem", ["AX"])]
+    path = str(tmp_path / "catalog.db")
+    SQLiteMedicationRepository.create(path, medications).close()
+    os.chmod(path, stat.S_IREAD)
+    
+    repository = SQLiteMedicationRepository(path, max_results=2)
+    try:
+        assert "aspirin" in [med.id for med in await repository.search("aspirin")]
+        # Short queries too: the exact brand on the shortest generic name is kept
+        assert "ax" in [med.id for med in await repository.search("ax")]
+        assert len(repository) == 7
+    finally:
+        repository.close()
+    assert repository._connections == []
+    with pytest.raises(FileNotFoundError):
+        SQLiteMedicationRepository(str(tmp_path / "missing.db"))
+
+@pytest.mark.asyncio
+async def test_postgres_repository_maps_rows_without_database():
+    """Row mapping and id validation work without a live PostgreSQL"""
+    from app.infrastructure.repositories.postgres_medication_repository import PostgresMedicationRepository
+    
+    repo = PostgresMedicationRepository()
+    assert await repo.find_by_id("not-a-uuid") is None
+    
+    medication = repo._to_domain({
+        "id": "6f1c2b7e-0000-4000-8000-000000000001", "generic_name": "aspirin",
+        "brand_names": None, "dosage_form": "unknown", "strength": None,
+        "prescription_required": False, "indications": ["pain"], "warnings": None
+    })
+    assert medication.dosage_form == MedicationForm.UNKNOWN
+    assert medication.brand_names == [] and medication.warnings == []
+
+@pytest.mark.asyncio
+async def test_search_cache_is_bypassed_without_a_catalog_version():
+    """Repositories that cannot version their data never serve cached pages"""
+    from app.infrastructure.search.result_cache import SearchResultCache
+    
+    class UnversionedRepository(InMemoryMedicationRepository):
+        catalog_version = None
+    
+    cache = SearchResultCache()
+    service = CogittoMedicationService(UnversionedRepository(), search_cache=cache)
+    await service.search_medications_page("pril")
+    await service.search_medications_page("pril")
+    assert len(cache) == 0 and cache.hits == 0
+
+@pytest.mark.asyncio
+async def test_search_cache_key_is_the_query_that_was_searched():
+    """Spellings that share a cache entry are searched in that one normalized form"""
+    from app.infrastructure.search.result_cache import SearchResultCache
+    
+    searched = []
+    
+    class RecordingRepository(InMemoryMedicationRepository):
+        async def search(self, query):
+            searched.append(query)
+            return await super().search(query)
+    
+    cache = SearchResultCache()
+    service = CogittoMedicationService(RecordingRepository(), search_cache=cache)
+    first = await service.search_medications_page("  LISINOPRIL ")
+    second = await service.search_medications_page("lisinopril")
+    assert searched == ["lisinopril"]
+    assert cache.hits == 1 and second.items == first.items
+    assert [med.generic_name for med in first.items] == ["lisinopril"]
+
+def test_postgres_brand_predicates_use_the_indexed_expression():
+    """Brand-name predicates repeat the trigram index expression so the planner can use it"""
+    from pathlib import Path
+    from app.infrastructure.repositories import postgres_medication_repository as postgres
+    
+    schema = (Path(__file__).parent.parent / "scripts" / "cogitto_schema.sql").read_text()
+    assert f"GIN({postgres.BRAND_TEXT} gin_trgm_ops)" in schema
+    assert "IMMUTABLE" in schema.split("FUNCTION medication_brand_text")[1].split(";")[0]
+    for statement in (postgres.SEARCH, postgres.FUZZY_SEARCH, postgres.FIND_BY_NAME):
+        assert postgres.BRAND_TEXT in statement.text and "array_to_string" not in statement.text
+    
+    # Existing databases get the same function, column expression and indexes
+    migration = (Path(__file__).parent.parent / "scripts" / "migrate_medication_search.sql").read_text()
+    for line in schema.splitlines():
+        if line.startswith("CREATE INDEX idx_medications_"):
+            assert line.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS") in migration
+    assert "to_tsvector('english', generic_name || ' ' || medication_brand_text(brand_names))" in migration
+    assert schema.split("FUNCTION medication_brand_text")[1].split(";")[0] in migration
+
+@pytest.mark.asyncio
+async def test_postgres_find_by_name_matches_brands_in_one_query():
+    """Batch name lookups resolve brand names in SQL instead of falling back to generic names only"""
+    from app.infrastructure.repositories import postgres_medication_repository as postgres
+    
+    executed = []
+    
+    class Result:
+        def mappings(self):
+            return self
+        
+        def all(self):
+            return [{"id": "warfarin", "generic_name": "warfarin", "brand_names": ["Coumadin"], "dosage_form": "Tablet",
+                     "strength": "5 mg", "prescription_required": True, "indications": [], "warnings": []}]
+    
+    class Session:
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            return False
+        
+        async def execute(self, statement, params):
+            executed.append((statement, params))
+            return Result()
+    
+    class Database:
+        def initialize(self):
+            pass
+        
+        async_session_maker = Session
+    
+    medication = await postgres.PostgresMedicationRepository(Database()).find_by_name(" Cou_madin ")
+    assert medication.generic_name == "warfarin"
+    assert executed == [(postgres.FIND_BY_NAME, {"name": "Cou_madin", "pattern": "%Cou\\_madin%"})]
+    assert "lower(:name) = ANY(" in postgres.FIND_BY_NAME.text
+
+@pytest.mark.asyncio
+async def test_cogitto_batch_lookup():
+    """Ids and names resolve in one call, in request order, without duplicates"""
+    repo = InMemoryMedicationRepository()
+    service = CogittoMedicationService(repo)
+    
+    result = await service.get_medications_batch(["3", "404", "1"], ["Tylenol", "metformin"])
+    assert [med.id for med in result["medications"]] == ["3", "1", "4"]
+    assert result["not_found"] == ["404"]
+    
+    with pytest.raises(ValueError):
+        await service.get_medications_batch([], [])
@@ -0,0 +1,70 @@
+# tests/test_regimen_screening.py
+import pytest
+from app.infrastructure.catalog.base_interactions import BASE_INTERACTIONS
+from app.infrastructure.catalog.interaction_index import InteractionIndex
+from app.services.regimen_screening import RegimenScreeningJob, medication_aliases, screen_chunk
+
+MEDICATIONS = [
+    {"generic_name": "ibuprofen and diphenhydramine", "brand_names": ["Advil"]},
+    {"generic_name": "Ibuprofen", "brand_names": ["Advil", "Motrin"]},
+    {"generic_name": "warfarin", "brand_names": ["Coumadin"]},
+]
+ALIASES = medication_aliases(MEDICATIONS, BASE_INTERACTIONS)
+
+@pytest.mark.asyncio
+async def test_screening_job_writes_findings_for_flagged_users():
+    """Chunks are screened in worker processes and written in user order, brands resolved"""
+    regimens = [
+        (1, ["Advil", "Coumadin"]),
+        (2, ["metformin"]),
+        (3, ["lisinopril", "ibuprofen", "metformin", "atorvastatin"]),
+        (4, []),
+        (5, ["aspirin", "omeprazole"]),
+        (6, ["warfarin", "ibuprofen", "acetaminophen"]),
+    ]
+    
+    async def chunks():
+        for start in range(0, len(regimens), 2):
+            yield regimens[start:start + 2]
+    
+    written = []
+    async def write(run_id, findings):
+        written.append((run_id, findings))
+    
+    summary = await RegimenScreeningJob(BASE_INTERACTIONS, ALIASES, processes=2).run(chunks(), write)
+    
+    assert (summary.users_screened, summary.users_flagged, summary.chunks) == (6, 3, 3)
+    assert {run_id for run_id, _ in written} == {summary.run_id}
+    findings = [result for _, batch in written for result in batch]
+    assert [result.user_id for result in findings] == [1, 3, 6]
+    
+    index = InteractionIndex(BASE_INTERACTIONS)
+    assert findings[0].findings[0]["medications"] == ["ibuprofen", "warfarin"]
+    assert findings[1].interacting_pairs == len(index.check_regimen(["lisinopril", "ibuprofen", "metformin", "atorvastatin"]))
+    assert findings[2].highest_severity == "major"
+    assert summary.severity_counts["major"] == 2
+
+def test_catalog_and_screening_job_resolve_brands_alike():
+    """The API's catalog and the nightly job share one alias resolution"""
+    from app.infrastructure.catalog.interaction_matrix import InteractionMatrix
+    from app.infrastructure.catalog.medication_catalog import MedicationCatalog
+    from app.infrastructure.catalog.records import build_records
+    
+    entries = [
+        dict(med, id=str(position), dosage_form="tablet", strength="", indications=[], warnings=[],
+             prescription_required=False)
+        for position, med in enumerate(MEDICATIONS)
+    ]
+    catalog = MedicationCatalog(build_records(entries), BASE_INTERACTIONS)
+    regimen = ["Advil", " COUMADIN", "unknown"]
+    
+    # The brand shared with a combination product resolves to the generic with interaction data
+    assert catalog.resolve_regimen(regimen) == ["ibuprofen", "warfarin", "unknown"]
+    assert catalog.brand_aliases == ALIASES
+    
+    index = InteractionIndex(BASE_INTERACTIONS)
+    [findings] = screen_chunk(index, InteractionMatrix(index), ALIASES, [(1, regimen)])
+    assert findings.findings[0]["medications"] == ["ibuprofen", "warfarin"]
+    assert [pair[:2] for pair in catalog.interaction_index.check_regimen(catalog.resolve_regimen(regimen))] == [
+        ("ibuprofen", "warfarin")
+    ]
@@ -0,0 +1,97 @@
+# tests/test_search_index.py
+from app.infrastructure.search.ngram_index import NGramIndex
+from app.infrastructure.search.prefix_index import PrefixIndex
+from app.infrastructure.search.fuzzy_index import FuzzyIndex, edit_distance
+from app.infrastructure.search.result_cache import SearchResultCache
+from app.infrastructure.search.facet_index import FacetIndex
+
+NAMES = [
+    ["acetaminophen", "Tylenol", "Panadol"],
+    ["ibuprofen", "Advil", "Motrin"],
+    ["lisinopril", "Prinivil", "Zestril"],
+]
+
+def test_ngram_index_matches_linear_scan():
+    """Index results match a plain substring scan, in load order"""
+    index = NGramIndex.from_names(NAMES)
+
+    for query in ["in", "pril", "ADVIL", "ol", "zz", "a", "acetaminophen"]:
+        expected = [
+            i for i, names in enumerate(NAMES)
+            if any(query.lower() in name.lower() for name in names)
+        ]
+        assert index.search(query) == expected, query
+
+def test_ngram_index_verifies_candidates():
+    """Shared n-grams alone are not enough for a match"""
+    index = NGramIndex.from_names([["abcxbcd"]])
+    assert index.search("abcd") == []
+    assert index.search("xbcd") == [0]
+
+def test_prefix_index_ranks_exact_then_generic():
+    """Exact names come first, generic names before brands and inner words"""
+    index = PrefixIndex([
+        ("sitagliptin and metformin hydrochloride", ["Zituvimet"]),
+        ("metformin", ["Glucophage"]),
+        ("metformin hydrochloride", ["Metformin ER"]),
+    ])
+
+    completions = index.complete("Metformin", limit=5)
+    assert [c.position for c in completions] == [1, 2, 0]
+    assert completions[0].exact
+    assert completions[2].match_type == "word"
+    assert len(index.complete("met", limit=1)) == 1
+    assert index.complete("zzz") == []
+
+def test_prefix_index_fills_limit_past_repeated_aliases():
+    """Many aliases of one drug under a prefix don't crowd out other drugs"""
+    aliases = [f"Tylenol {variant}" for variant in range(60)]
+    index = PrefixIndex([("acetaminophen", aliases), ("tylosin", []), ("tyloxapol", [])], scan_factor=2)
+
+    assert sorted(c.position for c in index.complete("tyl", limit=3)) == [0, 1, 2]
+    assert len(PrefixIndex([("acetaminophen", aliases), ("tylosin", [])], max_scan=10).complete("tyl", limit=2)) == 1
+
+def test_fuzzy_index_ranks_by_edit_distance():
+    """Misspelled names resolve to the closest catalog entries"""
+    index = FuzzyIndex(NAMES)
+
+    assert [m.position for m in index.lookup("ibuprofin")] == [1]
+    assert index.lookup("lisinipril")[0].distance == 1
+    assert index.lookup("advli")[0].position == 1  # transposition
+    assert index.lookup("warfarin") == []
+    assert edit_distance("kitten", "sitting", 2) == 3
+
+def test_search_result_cache_lru_ttl_and_versions():
+    """Entries are evicted by recency, expire by age and drop on a new catalog version"""
+    now = [0.0]
+    cache = SearchResultCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+
+    cache.put("a", 1, "v1")
+    cache.put("b", 2, "v1")
+    assert cache.get("a", "v1") == 1
+    cache.put("c", 3, "v1")  # evicts "b", the least recently used
+    assert cache.get("b", "v1") is None
+    assert cache.stats()["evictions"] == 1
+
+    now[0] = 11.0
+    assert cache.get("a", "v1") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache.put("c", 3, "v1")
+    assert cache.get("c", "v2") is None
+    assert len(cache) == 0 and cache.stats()["invalidations"] == 1
+
+def test_facet_index_combines_filters_and_counts():
+    """Facets AND together, values within a facet OR together"""
+    items = [
+        {"rx": True, "form": "Tablet"},
+        {"rx": False, "form": "tablet"},
+        {"rx": True, "form": "capsule"},
+    ]
+    index = FacetIndex(items, {"rx": lambda i: i["rx"], "form": lambda i: i["form"]})
+
+    bits = index.select({"rx": [True], "form": ["TABLET"]})
+    assert FacetIndex.positions(bits) == [0]
+    bits = index.select({"form": ["tablet", "capsule"], "rx": None})
+    assert FacetIndex.positions(bits, offset=1, limit=1) == [1]
+    assert index.counts(index.select({"rx": [True]}))["form"] == {"Tablet": 1, "capsule": 1}
@@ -0,0 +1,49 @@
+# tests/test_startup_profiler.py
+import sys
+from app.infrastructure.diagnostics.startup_profiler import StartupProfiler
+
+def test_startup_profiler_times_imports_and_stages(tmp_path, monkeypatch):
+    """Nested imports are attributed to their own module and stages are recorded by name"""
+    (tmp_path / "cogitto_outer_mod.py").write_text("import cogitto_inner_mod\n")
+    (tmp_path / "cogitto_inner_mod.py").write_text("import time\ntime.sleep(0.01)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    
+    profiler = StartupProfiler()
+    try:
+        with profiler.stage("load"):
+            import cogitto_outer_mod  # noqa: F401
+    finally:
+        profiler.finish()
+        sys.modules.pop("cogitto_outer_mod", None)
+        sys.modules.pop("cogitto_inner_mod", None)
+    
+    timings = {timing.module: timing for timing in profiler.imports}
+    assert timings["cogitto_inner_mod"].self_seconds >= 0.01
+    assert timings["cogitto_outer_mod"].cumulative_seconds >= timings["cogitto_inner_mod"].cumulative_seconds
+    assert timings["cogitto_outer_mod"].self_seconds < 0.01
+    assert profiler.report()["stages"][0]["name"] == "load"
+    assert profiler._finder not in sys.meta_path
+
+def test_startup_profilers_do_not_search_through_each_other(monkeypatch):
+    """With several profilers live (app.py imported twice), a missing module is looked up as often as with one"""
+    lookups = []
+    
+    class CountingFinder:
+        def find_spec(self, fullname, path, target=None):
+            if fullname == "cogitto_missing_mod":
+                lookups.append(fullname)
+            return None
+    
+    monkeypatch.setattr(sys, "meta_path", sys.meta_path + [CountingFinder()])
+    profilers = [StartupProfiler() for _ in range(3)]
+    try:
+        import cogitto_missing_mod  # noqa: F401
+    except ModuleNotFoundError:
+        pass
+    finally:
+        for profiler in profilers:
+            profiler.stop_tracing()
+    
+    # Once through the timer, once more by the import system itself
+    assert len(lookups) == 2
+    assert not any(profiler._finder in sys.meta_path for profiler in profilers)